@@ -21,65 +21,93 @@
 """PowerPoint builder implementation using python-pptx."""
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional, Union
+import functools
 import logging
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
-
 from ..base import Base_Builder
-from ..models.universal import Universal_Frame, Universal_Element, Element_Type, Layout_Type
+from ..models.universal import (
+    Universal_Frame, Universal_Element, Element_Type, Layout_Type,
+    Text_Content, Image_Content, Itemize_Content, Equation_Content,
+    Block_Content
+)
 from ..exceptions import BuilderError
 
 
+@functools.lru_cache(maxsize=None)
+def _pptx() -> SimpleNamespace:
+    """Import the python-pptx names used by the builder on first use.
+
+    python-pptx is slow to import, so it is only loaded once a theme or
+    presentation is actually built.
+    """
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.dml.color import RGBColor
+
+    return SimpleNamespace(Presentation=Presentation, Inches=Inches, Pt=Pt,
+                           RGBColor=RGBColor)
+
+
 class PowerPoint_Builder(Base_Builder):
     """Builder for PowerPoint presentations using python-pptx."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize PowerPoint builder."""
         self.supported_themes = ['default', 'professional', 'academic', 'minimal']
         self.default_theme = 'default'
         self.logger = logging.getLogger(__name__)
 
-        # Theme configurations
-        self.theme_configs = {
+        # Theme configurations, built on first use (they need python-pptx)
+        self._theme_configs: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def theme_configs(self) -> Dict[str, Dict[str, Any]]:
+        """Get the theme configurations, building them on first access."""
+        if self._theme_configs is None:
+            self._theme_configs = self._build_theme_configs()
+        return self._theme_configs
+
+    def _build_theme_configs(self) -> Dict[str, Dict[str, Any]]:
+        """Build the configuration for each supported theme."""
+        pptx = _pptx()
+        return {
             'default': {
-                'slide_width': Inches(10),
-                'slide_height': Inches(7.5),
+                'slide_width': pptx.Inches(10),
+                'slide_height': pptx.Inches(7.5),
                 'title_font_size': 44,
                 'content_font_size': 18,
-                'title_color': RGBColor(0, 0, 0),
-                'content_color': RGBColor(0, 0, 0),
-                'background_color': RGBColor(255, 255, 255)
+                'title_color': pptx.RGBColor(0, 0, 0),
+                'content_color': pptx.RGBColor(0, 0, 0),
+                'background_color': pptx.RGBColor(255, 255, 255)
             },
             'professional': {
-                'slide_width': Inches(10),
-                'slide_height': Inches(7.5),
+                'slide_width': pptx.Inches(10),
+                'slide_height': pptx.Inches(7.5),
                 'title_font_size': 40,
                 'content_font_size': 16,
-                'title_color': RGBColor(0, 32, 96),
-                'content_color': RGBColor(32, 32, 32),
-                'background_color': RGBColor(255, 255, 255)
+                'title_color': pptx.RGBColor(0, 32, 96),
+                'content_color': pptx.RGBColor(32, 32, 32),
+                'background_color': pptx.RGBColor(255, 255, 255)
             },
             'academic': {
-                'slide_width': Inches(10),
-                'slide_height': Inches(7.5),
+                'slide_width': pptx.Inches(10),
+                'slide_height': pptx.Inches(7.5),
                 'title_font_size': 42,
                 'content_font_size': 17,
-                'title_color': RGBColor(0, 0, 128),
-                'content_color': RGBColor(0, 0, 0),
-                'background_color': RGBColor(255, 255, 255)
+                'title_color': pptx.RGBColor(0, 0, 128),
+                'content_color': pptx.RGBColor(0, 0, 0),
+                'background_color': pptx.RGBColor(255, 255, 255)
             },
             'minimal': {
-                'slide_width': Inches(10),
-                'slide_height': Inches(7.5),
+                'slide_width': pptx.Inches(10),
+                'slide_height': pptx.Inches(7.5),
                 'title_font_size': 36,
                 'content_font_size': 14,
-                'title_color': RGBColor(64, 64, 64),
-                'content_color': RGBColor(64, 64, 64),
-                'background_color': RGBColor(255, 255, 255)
+                'title_color': pptx.RGBColor(64, 64, 64),
+                'content_color': pptx.RGBColor(64, 64, 64),
+                'background_color': pptx.RGBColor(255, 255, 255)
             }
         }
 
@@ -103,6 +131,8 @@ class PowerPoint_Builder(Base_Builder):
         Raises:
             BuilderError: If build fails
         """
+        pptx = _pptx()
+
         try:
             # Get options
             theme = kwargs.get('theme', self.default_theme)
@@ -127,7 +157,7 @@ class PowerPoint_Builder(Base_Builder):
             config = self.theme_configs[theme]
 
             # Create presentation
-            prs = Presentation()
+            prs = pptx.Presentation()
 
             # Set slide dimensions
             prs.slide_width = config['slide_width']
@@ -150,7 +180,7 @@ class PowerPoint_Builder(Base_Builder):
                     # Set font size with proper conversion
                     font_size = config.get('title_font_size', 44)
                     if font_size > 0:
-                        title_shape.text_frame.paragraphs[0].font.size = Pt(font_size)
+                        title_shape.text_frame.paragraphs[0].font.size = pptx.Pt(font_size)
 
                 # Add elements to slide, using content placeholder when possible
                 self._add_elements_to_slide(slide_obj, slide.elements, config, preserve_colors, include_images, source_path)
@@ -192,6 +222,8 @@ class PowerPoint_Builder(Base_Builder):
     def _add_elements_to_slide(self, slide_obj, elements: List[Universal_Element],
                               config: Dict[str, Any], preserve_colors: bool, include_images: bool, source_path: str = ''):
         """Add elements to a PowerPoint slide using native placeholders when possible."""
+        pptx = _pptx()
+
         content_placeholder_used = False
 
         for element in elements:
@@ -217,32 +249,41 @@ class PowerPoint_Builder(Base_Builder):
                     self._add_equation_element(slide_obj, element, config, source_path)
                 elif element.element_type == Element_Type.BLOCK:
                     # Always use element method for blocks to ensure they appear
-                    current_top = Inches(2.5)  # Start below title
+                    current_top = pptx.Inches(2.5)  # Start below title
                     self._add_block_element(slide_obj, element, config, preserve_colors, current_top)
             except Exception as e:
                 self.logger.warning(f"Failed to add element {element.element_type}: {e}")
 
+    def _element_text(self, element: Universal_Element) -> str:
+        """Get the text of a text or title element."""
+        content = element.content
+        if isinstance(content, str):
+            return content
+        if isinstance(content, Text_Content):
+            return content.text
+        raise BuilderError(
+            f"Element has no text content: {type(content).__name__}",
+            operation="add_text", output_format="pptx")
+
     def _add_text_element(self, slide_obj, element: Universal_Element,
                           config: Dict[str, Any], preserve_colors: bool):
         """Add a text element to the slide using its predefined position."""
-        content = element.content
-        if isinstance(content, str):
-            text = content
-        else:
-            text = content.text
+        pptx = _pptx()
+
+        text = self._element_text(element)
 
         # Use position from element if available, otherwise fallback
         if element.position:
-            left = Inches(element.position.x)
-            top = Inches(element.position.y)
-            width = Inches(element.position.width) if element.position.width else Inches(8)
-            height = Inches(element.position.height) if element.position.height else Inches(1.5)
+            left = pptx.Inches(element.position.x)
+            top = pptx.Inches(element.position.y)
+            width = pptx.Inches(element.position.width) if element.position.width else pptx.Inches(8)
+            height = pptx.Inches(element.position.height) if element.position.height else pptx.Inches(1.5)
         else:
             # Fallback positioning
-            left = Inches(1)
-            top = Inches(2)
-            width = Inches(8)
-            height = Inches(1.5)
+            left = pptx.Inches(1)
+            top = pptx.Inches(2)
+            width = pptx.Inches(8)
+            height = pptx.Inches(1.5)
 
         text_box = slide_obj.shapes.add_textbox(left, top, width, height)
         text_frame = text_box.text_frame
@@ -262,7 +303,7 @@ class PowerPoint_Builder(Base_Builder):
             # Set font size with proper conversion
             font_size = config.get('content_font_size', 18)
             if font_size > 0:
-                p.font.size = Pt(font_size)
+                p.font.size = pptx.Pt(font_size)
 
             if preserve_colors:
                 p.font.color.rgb = config['content_color']
@@ -270,11 +311,9 @@ class PowerPoint_Builder(Base_Builder):
     def _add_title_element(self, slide_obj, element: Universal_Element,
                            config: Dict[str, Any], preserve_colors: bool):
         """Add a title element to the slide."""
-        content = element.content
-        if isinstance(content, str):
-            text = content
-        else:
-            text = content.text
+        pptx = _pptx()
+
+        text = self._element_text(element)
 
         # Add to existing title shape if available, otherwise create new one
         if slide_obj.shapes.title:
@@ -285,13 +324,14 @@ class PowerPoint_Builder(Base_Builder):
             # Set font size with proper conversion
             font_size = config.get('title_font_size', 44)
             if font_size > 0:
-                title_shape.text_frame.paragraphs[0].font.size = Pt(font_size)
+                title_font = title_shape.text_frame.paragraphs[0].font
+                title_font.size = pptx.Pt(font_size)
         else:
             # Create new title text box
-            left = Inches(1) if element.position else Inches(1)
-            top = Inches(0.5) if element.position else Inches(0.5)
-            width = Inches(8) if element.size else Inches(8)
-            height = Inches(1) if element.size else Inches(1)
+            left = pptx.Inches(1) if element.position else pptx.Inches(1)
+            top = pptx.Inches(0.5) if element.position else pptx.Inches(0.5)
+            width = pptx.Inches(8) if element.size else pptx.Inches(8)
+            height = pptx.Inches(1) if element.size else pptx.Inches(1)
 
             title_box = slide_obj.shapes.add_textbox(left, top, width, height)
             title_frame = title_box.text_frame
@@ -309,8 +349,12 @@ class PowerPoint_Builder(Base_Builder):
     def _add_itemize_element(self, slide_obj, element: Universal_Element,
                            config: Dict[str, Any], preserve_colors: bool):
         """Add a bullet list element to the slide using its predefined position."""
+        pptx = _pptx()
+
         content = element.content
-        if isinstance(content, dict) and 'items' in content:
+        if isinstance(content, Itemize_Content):
+            items = content.items
+        elif isinstance(content, dict) and 'items' in content:
             items = content['items']
         else:
             # Try to parse as string
@@ -318,16 +362,16 @@ class PowerPoint_Builder(Base_Builder):
 
         # Use position from element if available, otherwise fallback
         if element.position:
-            left = Inches(element.position.x)
-            top = Inches(element.position.y)
-            width = Inches(element.position.width) if element.position.width else Inches(8)
-            height = Inches(element.position.height) if element.position.height else Inches(max(0.5, len(items) * 0.4))
+            left = pptx.Inches(element.position.x)
+            top = pptx.Inches(element.position.y)
+            width = pptx.Inches(element.position.width) if element.position.width else pptx.Inches(8)
+            height = pptx.Inches(element.position.height) if element.position.height else pptx.Inches(max(0.5, len(items) * 0.4))
         else:
             # Fallback positioning
-            left = Inches(1)
-            top = Inches(2)
-            width = Inches(8)
-            height = Inches(max(0.5, len(items) * 0.4))
+            left = pptx.Inches(1)
+            top = pptx.Inches(2)
+            width = pptx.Inches(8)
+            height = pptx.Inches(max(0.5, len(items) * 0.4))
 
         text_box = slide_obj.shapes.add_textbox(left, top, width, height)
         text_frame = text_box.text_frame
@@ -343,16 +387,24 @@ class PowerPoint_Builder(Base_Builder):
             # Set font size with proper conversion
             font_size = config.get('content_font_size', 18)
             if font_size > 0:
-                p.font.size = Pt(font_size)
+                p.font.size = pptx.Pt(font_size)
 
             if preserve_colors:
                 p.font.color.rgb = config['content_color']
 
     def _add_image_element(self, slide_obj, element: Universal_Element,
-                          config: Dict[str, Any], source_path: str = '', current_top = Inches(2)):
+                           config: Dict[str, Any], source_path: str = '',
+                           current_top=None):
         """Add an image element to the slide and return the new top position."""
+        pptx = _pptx()
+
+        if current_top is None:
+            current_top = pptx.Inches(2)
         content = element.content
-        if isinstance(content, dict) and 'path' in content:
+        image_path: Union[str, Path]
+        if isinstance(content, Image_Content):
+            image_path = content.path
+        elif isinstance(content, dict) and 'path' in content:
             image_path = content['path']
         else:
             image_path = str(content)
@@ -369,15 +421,15 @@ class PowerPoint_Builder(Base_Builder):
                     image_path = Path.cwd() / image_path
 
             if Path(image_path).exists():
-                left = Inches(1) if element.position else Inches(1)
+                left = pptx.Inches(1) if element.position else pptx.Inches(1)
                 top = current_top
-                width = Inches(6) if element.size else Inches(6)
-                height = Inches(4) if element.size else None
+                width = pptx.Inches(6) if element.size else pptx.Inches(6)
+                height = pptx.Inches(4) if element.size else None
 
                 slide_obj.shapes.add_picture(str(image_path), left, top, width, height)
 
                 # Return the new top position (below this image)
-                image_height = height if height else Inches(4)
+                image_height = height if height else pptx.Inches(4)
                 return top + image_height
             else:
                 self.logger.warning(f"Image file not found: {image_path}")
@@ -389,11 +441,13 @@ class PowerPoint_Builder(Base_Builder):
     def _add_block_element(self, slide_obj, element: Universal_Element,
                           config: Dict[str, Any], preserve_colors: bool, current_top):
         """Add a Beamer-style block element to the slide and return the new top position."""
+        pptx = _pptx()
+
         print(f"DEBUG: _add_block_element called!")
         content = element.content
 
         # Extract title, content, and type from block
-        if isinstance(content, dict):
+        if isinstance(content, (dict, Block_Content)):
             block_type = content.get('type', 'block')
             block_title = content.get('title', 'Block')
 
@@ -405,10 +459,10 @@ class PowerPoint_Builder(Base_Builder):
             block_title = 'Block'
             block_content = str(content)
 
-        left = Inches(1) if element.position else Inches(1)
+        left = pptx.Inches(1) if element.position else pptx.Inches(1)
         top = current_top
-        width = Inches(8) if element.size else Inches(8)
-        height = Inches(1.5) if element.size else Inches(1.5)  # Taller for blocks
+        width = pptx.Inches(8) if element.size else pptx.Inches(8)
+        height = pptx.Inches(1.5) if element.size else pptx.Inches(1.5)  # Taller for blocks
 
         # Create text box with Beamer-style formatting
         text_box = slide_obj.shapes.add_textbox(left, top, width, height)
@@ -419,25 +473,27 @@ class PowerPoint_Builder(Base_Builder):
 
         # Set colors based on block type
         if block_type == 'alertblock':
-            fill.fore_color.rgb = RGBColor(220, 38, 127)  # Beamer alert red
-            text_color = RGBColor(255, 255, 255)  # White text
+            # Beamer alert red
+            fill.fore_color.rgb = pptx.RGBColor(220, 38, 127)
+            text_color = pptx.RGBColor(255, 255, 255)  # White text
         elif block_type == 'exampleblock':
-            fill.fore_color.rgb = RGBColor(0, 128, 0)  # Beamer example green
-            text_color = RGBColor(255, 255, 255)  # White text
+            # Beamer example green
+            fill.fore_color.rgb = pptx.RGBColor(0, 128, 0)
+            text_color = pptx.RGBColor(255, 255, 255)  # White text
         else:  # regular block
-            fill.fore_color.rgb = RGBColor(59, 89, 152)  # Beamer blue background
-            text_color = RGBColor(255, 255, 255)  # White text
+            fill.fore_color.rgb = pptx.RGBColor(59, 89, 152)  # Beamer blue background
+            text_color = pptx.RGBColor(255, 255, 255)  # White text
 
         # Add border
         line = text_box.line
-        line.color.rgb = RGBColor(0, 0, 0)  # Black border
-        line.width = Pt(1)  # Thin border
+        line.color.rgb = pptx.RGBColor(0, 0, 0)  # Black border
+        line.width = pptx.Pt(1)  # Thin border
 
         text_frame = text_box.text_frame
-        text_frame.margin_left = Inches(0.1)
-        text_frame.margin_right = Inches(0.1)
-        text_frame.margin_top = Inches(0.1)
-        text_frame.margin_bottom = Inches(0.1)
+        text_frame.margin_left = pptx.Inches(0.1)
+        text_frame.margin_right = pptx.Inches(0.1)
+        text_frame.margin_top = pptx.Inches(0.1)
+        text_frame.margin_bottom = pptx.Inches(0.1)
 
         # Add title paragraph (bold, white)
         if block_title:
@@ -447,12 +503,13 @@ class PowerPoint_Builder(Base_Builder):
             title_p.font.color.rgb = text_color
             title_font_size = config.get('content_font_size', 18)
             if title_font_size > 0:
-                title_p.font.size = Pt(title_font_size)
+                title_p.font.size = pptx.Pt(title_font_size)
 
         # Add content paragraph (white) - handle nested elements
         if block_content:
             # Check if block has nested elements (new structure) or raw content (old structure)
-            if isinstance(block_content, dict) and 'elements' in block_content:
+            if (isinstance(block_content, (dict, Block_Content))
+                    and 'elements' in block_content):
                 # New structure: block has parsed elements
                 block_elements = block_content['elements']
 
@@ -464,23 +521,28 @@ class PowerPoint_Builder(Base_Builder):
                         text_p = text_frame.add_paragraph()
                         text_p.text = block_elem.content if isinstance(block_elem.content, str) else str(block_elem.content)
                         text_p.font.color.rgb = text_color
-                        text_p.font.size = Pt(config.get('content_font_size', 18))
+                        text_p.font.size = pptx.Pt(config.get('content_font_size', 18))
                         current_top += 0.4
 
                     elif block_elem.element_type == Element_Type.EQUATION:
                         # Add equation image to block
                         if hasattr(self, '_render_latex_equation'):
-                            eq_content = block_elem.content.get('latex', '') if isinstance(block_elem.content, dict) else str(block_elem.content)
-                            eq_type = block_elem.content.get('type', 'inline') if isinstance(block_elem.content, dict) else 'inline'
+                            eq_value = block_elem.content
+                            eq_is_mapping = isinstance(
+                                eq_value, (dict, Equation_Content))
+                            eq_content = (eq_value.get('latex', '')
+                                          if eq_is_mapping else str(eq_value))
+                            eq_type = (eq_value.get('type', 'inline')
+                                       if eq_is_mapping else 'inline')
 
                             eq_image_path = self._render_latex_equation(eq_content, eq_type, '')
 
                             if eq_image_path and eq_image_path.exists():
                                 # Add equation image to block
-                                eq_left = Inches(0.1)
-                                eq_top = Inches(0.1) + current_top
-                                eq_width = Inches(7.8)
-                                eq_height = Inches(0.8)
+                                eq_left = pptx.Inches(0.1)
+                                eq_top = pptx.Inches(0.1) + current_top
+                                eq_width = pptx.Inches(7.8)
+                                eq_height = pptx.Inches(0.8)
 
                                 # Add equation image to block (add to slide, not text frame)
                                 # Note: Images within text frames are not directly supported in python-pptx
@@ -491,7 +553,7 @@ class PowerPoint_Builder(Base_Builder):
                                 text_p = text_frame.add_paragraph()
                                 text_p.text = eq_content
                                 text_p.font.color.rgb = text_color
-                                text_p.font.size = Pt(config.get('content_font_size', 18))
+                                text_p.font.size = pptx.Pt(config.get('content_font_size', 18))
                                 current_top += 0.4
 
                     elif block_elem.element_type == Element_Type.IMAGE:
@@ -506,7 +568,7 @@ class PowerPoint_Builder(Base_Builder):
                 content_p.font.color.rgb = text_color
                 content_font_size = config.get('content_font_size', 18)
                 if content_font_size > 0:
-                    content_p.font.size = Pt(content_font_size)
+                    content_p.font.size = pptx.Pt(content_font_size)
 
         # Return the new top position (below this element)
         return top + height
@@ -514,6 +576,8 @@ class PowerPoint_Builder(Base_Builder):
     def _add_text_to_placeholder(self, slide_obj, element: Universal_Element,
                                 config: Dict[str, Any], preserve_colors: bool) -> bool:
         """Add text to the slide's content placeholder. Returns True if successful."""
+        pptx = _pptx()
+
         try:
             # Find the content placeholder (check both type and name for robustness)
             for placeholder in slide_obj.placeholders:
@@ -530,11 +594,7 @@ class PowerPoint_Builder(Base_Builder):
                 )
 
                 if is_body_placeholder and not is_title_placeholder:
-                    content = element.content
-                    if isinstance(content, str):
-                        text = content
-                    else:
-                        text = content.text
+                    text = self._element_text(element)
 
                     placeholder.text = text
 
@@ -544,7 +604,7 @@ class PowerPoint_Builder(Base_Builder):
                         # Set font size with proper conversion
                         font_size = config.get('content_font_size', 18)
                         if font_size > 0:
-                            paragraph.font.size = Pt(font_size)
+                            paragraph.font.size = pptx.Pt(font_size)
 
                         if preserve_colors:
                             paragraph.font.color.rgb = config['content_color']
@@ -558,6 +618,8 @@ class PowerPoint_Builder(Base_Builder):
     def _add_itemize_to_placeholder(self, slide_obj, element: Universal_Element,
                                     config: Dict[str, Any], preserve_colors: bool) -> bool:
         """Add itemize to the slide's content placeholder. Returns True if successful."""
+        pptx = _pptx()
+
         try:
             # Find the content placeholder (check both type and name for robustness)
             for placeholder in slide_obj.placeholders:
@@ -575,7 +637,9 @@ class PowerPoint_Builder(Base_Builder):
 
                 if is_body_placeholder and not is_title_placeholder:
                     content = element.content
-                    if isinstance(content, dict) and 'items' in content:
+                    if isinstance(content, Itemize_Content):
+                        items = content.items
+                    elif isinstance(content, dict) and 'items' in content:
                         items = content['items']
                     else:
                         items = [str(content)]
@@ -595,7 +659,7 @@ class PowerPoint_Builder(Base_Builder):
                         # Set font size with proper conversion
                         font_size = config.get('content_font_size', 18)
                         if font_size > 0:
-                            p.font.size = Pt(font_size)
+                            p.font.size = pptx.Pt(font_size)
 
                         if preserve_colors:
                             p.font.color.rgb = config['content_color']
@@ -620,10 +684,16 @@ class PowerPoint_Builder(Base_Builder):
     def _add_equation_element(self, slide_obj, element: Universal_Element,
                             config: Dict[str, Any], source_path: str = ''):
         """Add an equation element by rendering LaTeX to image."""
+        pptx = _pptx()
+
         try:
             content = element.content
-            latex_equation = content.get('latex', '')
-            equation_type = content.get('type', 'inline')
+            if isinstance(content, Equation_Content):
+                latex_equation = content.latex
+                equation_type = content.type
+            else:
+                latex_equation = content.get('latex', '')
+                equation_type = content.get('type', 'inline')
 
             if not latex_equation:
                 self.logger.warning("Empty equation content")
@@ -634,16 +704,16 @@ class PowerPoint_Builder(Base_Builder):
 
             if image_path and Path(image_path).exists():
                 # Add as image with equation-specific positioning
-                left = Inches(1) if element.position else Inches(1)
-                top = Inches(2) if element.position else Inches(2)
+                left = pptx.Inches(1) if element.position else pptx.Inches(1)
+                top = pptx.Inches(2) if element.position else pptx.Inches(2)
 
                 # Different sizing for inline vs display equations
                 if equation_type == 'inline':
-                    width = Inches(2) if element.size else Inches(2)
-                    height = Inches(0.5) if element.size else Inches(0.5)
+                    width = pptx.Inches(2)
+                    height = pptx.Inches(0.5)
                 else:  # display
-                    width = Inches(6) if element.size else Inches(6)
-                    height = Inches(1.5) if element.size else Inches(1.5)
+                    width = pptx.Inches(6)
+                    height = pptx.Inches(1.5)
 
                 slide_obj.shapes.add_picture(str(image_path), left, top, width, height)
                 self.logger.info(f"Successfully added equation: {latex_equation[:50]}...")
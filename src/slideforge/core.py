@@ -21,15 +21,22 @@
 """Slide Forge Core - Bidirectional presentation converter."""
 
 # Python Standard Libraries
+import importlib.util
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 # Project Libraries
 from .base import Base_Builder, Base_Mapper, Base_Parser, Format_Detector
 from .exceptions import BuilderError, MappingError, ParseError, Slide_Forge_Error
 from .models.universal import Conversion_Options, Universal_Document
 
+# Display names of the formats the built-in components handle
+_FORMAT_LABELS = {'latex': 'LaTeX', 'pptx': 'PowerPoint'}
+
+# Parser classes and builder classes by format, and the mapper class
+_Component_Classes = Tuple[Dict[str, type], Dict[str, type], Optional[type]]
+
 
 class Slide_Forge:
     """
@@ -38,65 +45,101 @@ class Slide_Forge:
     Supports conversions between LaTeX Beamer, PowerPoint, and other presentation formats.
     """
 
-    def __init__(self):
-        """Initialize Slide Forge with default configuration."""
+    def __init__(self, auto_register: bool = True):
+        """
+        Initialize Slide Forge with default configuration.
+
+        Args:
+            auto_register: Register the available parsers, builders and mapper;
+                pass False to start empty and register components manually
+        """
         self.logger = logging.getLogger(__name__)
 
         # Initialize components
-        self.parsers = {}
-        self.builders = {}
-        self.mapper = None
+        self.parsers: Dict[str, Base_Parser] = {}
+        self.builders: Dict[str, Base_Builder] = {}
+        self.mapper: Optional[Base_Mapper] = None
         self.format_detector = Format_Detector()
 
         # Set default options
         self.default_options = Conversion_Options()
 
         # Initialize components (will register available parsers/builders)
-        self._initialize_components()
+        if auto_register:
+            self._initialize_components()
+
+    # Component classes found by _discover_components, shared by all instances
+    _component_classes: Optional[_Component_Classes] = None
+
+    @classmethod
+    def _discover_components(cls) -> _Component_Classes:
+        """
+        Import the available parser, builder and mapper classes once.
+
+        Returns:
+            Tuple of (parser classes by format, builder classes by format,
+            mapper class)
+        """
+        if cls._component_classes is not None:
+            return cls._component_classes
+
+        logger = logging.getLogger(__name__)
+        parser_classes: Dict[str, type] = {}
+        builder_classes: Dict[str, type] = {}
+        mapper_class: Optional[type] = None
 
-    def _initialize_components(self):
-        """Initialize available parsers and builders."""
         try:
-            # Import and register LaTeX parser
+            # Import LaTeX parser
             from .parsers.latex_parser import LaTeX_Parser
-            self.register_parser('latex', LaTeX_Parser())
-            self.logger.info("Registered LaTeX parser")
+            parser_classes['latex'] = LaTeX_Parser
         except ImportError:
-            self.logger.warning("LaTeX parser not available")
+            logger.warning("LaTeX parser not available")
 
-        try:
-            # Import and register PowerPoint parser (future)
-            # from .parsers.pptx_parser import PowerPoint_Parser
-            # self.register_parser('pptx', PowerPoint_Parser())
-            # self.logger.info("Registered PowerPoint parser")
-            pass
-        except ImportError:
-            self.logger.warning("PowerPoint parser not available")
+        # PowerPoint parser (future)
+        # from .parsers.pptx_parser import PowerPoint_Parser
+        # parser_classes['pptx'] = PowerPoint_Parser
 
         try:
-            # Import and register PowerPoint builder
+            # Import PowerPoint builder; it imports python-pptx lazily, so
+            # check that the package is installed without importing it
+            if importlib.util.find_spec('pptx') is None:
+                raise ImportError("python-pptx is not installed")
             from .builders.powerpoint_builder import PowerPoint_Builder
-            self.register_builder('pptx', PowerPoint_Builder())
-            self.logger.info("Registered PowerPoint builder")
+            builder_classes['pptx'] = PowerPoint_Builder
         except ImportError:
-            self.logger.warning("PowerPoint builder not available")
+            logger.warning("PowerPoint builder not available")
 
-        try:
-            # Import and register LaTeX builder (future)
-            # from .builders.latex_builder import LaTeX_Builder
-            # self.register_builder('latex', LaTeX_Builder())
-            # self.logger.info("Registered LaTeX builder")
-            pass
-        except ImportError:
-            self.logger.warning("LaTeX builder not available")
+        # LaTeX builder (future)
+        # from .builders.latex_builder import LaTeX_Builder
+        # builder_classes['latex'] = LaTeX_Builder
 
         try:
-            # Import and register content mapper
+            # Import content mapper
             from .mappers.content_mapper import Content_Mapper
-            self.mapper = Content_Mapper()
-            self.logger.info("Registered content mapper")
+            mapper_class = Content_Mapper
         except ImportError:
-            self.logger.warning("Content mapper not available")
+            logger.warning("Content mapper not available")
+
+        classes = (parser_classes, builder_classes, mapper_class)
+        cls._component_classes = classes
+        return classes
+
+    def _initialize_components(self):
+        """Initialize available parsers and builders."""
+        parser_classes, builder_classes, mapper_class = (
+            self._discover_components())
+
+        # Fresh instances per controller; only the imports are shared
+        for format_name, parser_class in parser_classes.items():
+            self.register_parser(format_name, parser_class())
+            label = _FORMAT_LABELS[format_name]
+            self.logger.info(f"Registered {label} parser")
+        for format_name, builder_class in builder_classes.items():
+            self.register_builder(format_name, builder_class())
+            label = _FORMAT_LABELS[format_name]
+            self.logger.info(f"Registered {label} builder")
+        if mapper_class is not None:
+            self.register_mapper(mapper_class())
 
     def register_parser(self, format_name: str, parser: Base_Parser):
         """
@@ -218,7 +261,8 @@ class Slide_Forge:
             builder = self.builders[target_format]
 
             # Pass source path for image resolution (convert to string)
-            build_options = {**options.custom_settings, 'source_path': str(document.source_path)}
+            build_options = self._make_build_options(
+                options.custom_settings, document.source_path)
             success = builder.build_presentation(slide_structures, output_path, **build_options)
 
             if success and options.verbose:
@@ -281,7 +325,7 @@ class Slide_Forge:
             builder = self.builders[target_format]
 
             # Pass source path for image resolution (empty for string conversion)
-            build_options = {**options.custom_settings, 'source_path': ''}
+            build_options = self._make_build_options(options.custom_settings)
             return builder.build_presentation(slide_structures, output_path, **build_options)
 
         except Exception as e:
@@ -291,6 +335,20 @@ class Slide_Forge:
             else:
                 raise Slide_Forge_Error(f"Unexpected error during string conversion: {e}")
 
+    def _make_build_options(self, custom_settings: Mapping[str, Any],
+                            source_path: Any = '') -> Dict[str, Any]:
+        """
+        Merge custom settings with the source path into builder options.
+
+        Args:
+            custom_settings: Custom conversion settings
+            source_path: Path of the source document, used for image resolution
+
+        Returns:
+            Keyword options for the builder's build_presentation
+        """
+        return {**custom_settings, 'source_path': str(source_path)}
+
     def _document_to_slides(self, document: Universal_Document) -> List[Any]:
         """
         Convert Universal_Document to slide structures (placeholder implementation).
@@ -319,7 +377,7 @@ class Slide_Forge:
         Returns:
             List of (source_format, target_format) tuples
         """
-        conversions = []
+        conversions: List[tuple] = []
         if self.mapper:
             supported = self.mapper.get_supported_conversions()
             for source, targets in supported.items():
@@ -25,7 +25,7 @@ from typing import List, Dict, Any
 from ..base import Base_Mapper
 from ..models.universal import (
     Universal_Document, Universal_Frame, Universal_Element,
-    Position, Size, Layout_Type, Element_Type
+    Position, Size, Layout_Type, Element_Type, Text_Content, Itemize_Content
 )
 from ..exceptions import MappingError
 
@@ -33,6 +33,14 @@ from ..exceptions import MappingError
 class Content_Mapper(Base_Mapper):
     """Content mapper for bidirectional format conversions."""
 
+    # Layout constants (in inches from top-left)
+    MARGIN_LEFT = 1.0
+    MARGIN_RIGHT = 1.0
+    MARGIN_TOP = 2.5  # Below title
+    ELEMENT_SPACING = 0.4
+    SLIDE_WIDTH = 10.0
+    CONTENT_WIDTH = SLIDE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+
     def __init__(self):
         """Initialize content mapper."""
         self.supported_conversions = {
@@ -76,13 +84,8 @@ class Content_Mapper(Base_Mapper):
         Returns:
             List of slide structures for PowerPoint builder with positions set
         """
-        positioned_frames = []
-
-        for frame in document.frames:
-            positioned_frame = self._position_frame_elements(frame)
-            positioned_frames.append(positioned_frame)
-
-        return positioned_frames
+        position_frame_elements = self._position_frame_elements
+        return [position_frame_elements(frame) for frame in document.frames]
 
     def _position_frame_elements(self, frame: Universal_Frame) -> Universal_Frame:
         """
@@ -94,38 +97,37 @@ class Content_Mapper(Base_Mapper):
         Returns:
             Universal_Frame with positioned elements
         """
-        # Layout constants (in inches from top-left)
-        MARGIN_LEFT = 1.0
-        MARGIN_RIGHT = 1.0
-        MARGIN_TOP = 2.5  # Below title
-        ELEMENT_SPACING = 0.4
-        SLIDE_WIDTH = 10.0
-        CONTENT_WIDTH = SLIDE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+        margin_left = self.MARGIN_LEFT
+        content_width = self.CONTENT_WIDTH
+        element_spacing = self.ELEMENT_SPACING
+        position_element = self._position_element
+
+        current_y = self.MARGIN_TOP
 
-        current_y = MARGIN_TOP
+        # Position elements in one sequential pass over the source frame
+        positioned_elements = []
+        for element in frame.elements:
+            positioned_element = position_element(
+                element, current_y, margin_left, content_width)
+            positioned_elements.append(positioned_element)
+
+            # Update current_y based on element height
+            if positioned_element.position:
+                element_height = positioned_element.position.height or 0.5
+                current_y += element_height + element_spacing
 
         # Create a new frame with positioned elements
-        positioned_frame = Universal_Frame(
+        return Universal_Frame(
             frame_number=frame.frame_number,
             title=frame.title,
             subtitle=frame.subtitle,
+            elements=positioned_elements,
             layout=frame.layout,
             background_color=frame.background_color,
             notes=frame.notes,
             metadata=frame.metadata
         )
 
-        for element in frame.elements:
-            positioned_element = self._position_element(element, current_y, MARGIN_LEFT, CONTENT_WIDTH)
-            positioned_frame.add_element(positioned_element)
-
-            # Update current_y based on element height
-            if positioned_element.position:
-                element_height = positioned_element.position.height or 0.5
-                current_y += element_height + ELEMENT_SPACING
-
-        return positioned_frame
-
     def _position_element(self, element: Universal_Element, current_y: float,
                          left_margin: float, content_width: float) -> Universal_Element:
         """
@@ -140,14 +142,16 @@ class Content_Mapper(Base_Mapper):
         Returns:
             Universal_Element with calculated position
         """
-        # Calculate element dimensions based on type
-        if element.element_type == Element_Type.TEXT:
+        # Calculate element dimensions based on type (enum members are
+        # singletons, so identity checks are enough)
+        element_type = element.element_type
+        if element_type is Element_Type.TEXT:
             height = self._estimate_text_height(element.content, content_width)
-        elif element.element_type == Element_Type.ITEMIZE:
+        elif element_type is Element_Type.ITEMIZE:
             height = self._estimate_itemize_height(element.content, content_width)
-        elif element.element_type == Element_Type.IMAGE:
+        elif element_type is Element_Type.IMAGE:
             height = 4.0  # Default image height
-        elif element.element_type == Element_Type.BLOCK:
+        elif element_type is Element_Type.BLOCK:
             height = self._estimate_text_height(element.content, content_width)
         else:
             height = 0.5  # Default height
@@ -162,7 +166,7 @@ class Content_Mapper(Base_Mapper):
 
         # Create new element with position
         positioned_element = Universal_Element(
-            element_type=element.element_type,
+            element_type=element_type,
             content=element.content,
             position=position,
             size=element.size,
@@ -175,18 +179,20 @@ class Content_Mapper(Base_Mapper):
 
     def _estimate_text_height(self, content, width: float) -> float:
         """Estimate height needed for text content."""
-        if isinstance(content, str):
-            text = content
+        if isinstance(content, Text_Content):
+            lines = content.line_count
         else:
-            text = str(content)
+            text = content if isinstance(content, str) else str(content)
+            lines = text.count('\n') + 1
 
         # Rough estimation: ~0.3 inches per line
-        lines = len(text.split('\n'))
         return max(0.3, lines * 0.3)
 
     def _estimate_itemize_height(self, content, width: float) -> float:
         """Estimate height needed for itemize content."""
-        if isinstance(content, dict) and 'items' in content:
+        if isinstance(content, Itemize_Content):
+            items = content.items
+        elif isinstance(content, dict) and 'items' in content:
             items = content['items']
         else:
             items = [str(content)]
@@ -29,6 +29,10 @@ from .universal import (
     Layout_Type,
     Formatting,
     Text_Content,
+    Image_Content,
+    Itemize_Content,
+    Equation_Content,
+    Block_Content,
     Position,
     Size,
     Conversion_Options,
@@ -37,6 +41,7 @@ from .universal import (
     create_image_element,
     create_itemize_element,
     create_equation_element,
+    create_block_element,
     merge_documents
 )
 
@@ -49,6 +54,10 @@ __all__ = [
     'Layout_Type',
     'Formatting',
     'Text_Content',
+    'Image_Content',
+    'Itemize_Content',
+    'Equation_Content',
+    'Block_Content',
     'Position',
     'Size',
     'Conversion_Options',
@@ -56,5 +65,6 @@ __all__ = [
     'create_image_element',
     'create_itemize_element',
     'create_equation_element',
+    'create_block_element',
     'merge_documents'
 ]
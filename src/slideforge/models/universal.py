@@ -20,9 +20,11 @@
 
 """Universal data models for Slide Forge - format-agnostic representations."""
 
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union
-from enum import Enum
+from typing import List, Dict, Any, ClassVar, Iterable, Optional, Union
+from enum import Enum, IntFlag
 from pathlib import Path
 
 
@@ -44,6 +46,11 @@ class Element_Type(Enum):
     CHART = "chart"
 
 
+# Element types rendered as plain text
+_TEXT_ELEMENT_TYPES = frozenset({
+    Element_Type.TEXT, Element_Type.TITLE, Element_Type.SUBTITLE})
+
+
 class Layout_Type(Enum):
     """Universal slide layout types."""
     TITLE_SLIDE = "title_slide"
@@ -55,35 +62,184 @@ class Layout_Type(Enum):
     CONTENT_ONLY = "content_only"
 
 
-class Formatting(Enum):
-    """Text formatting options."""
-    BOLD = "bold"
-    ITALIC = "italic"
-    UNDERLINE = "underline"
-    STRIKETHROUGH = "strikethrough"
-    SUPERSCRIPT = "superscript"
-    SUBSCRIPT = "subscript"
-    MONOSPACE = "monospace"
-    NORMAL = "normal"
+class Formatting(IntFlag):
+    """Text formatting options, combinable as bit flags."""
+    NORMAL = 0
+    BOLD = 1
+    ITALIC = 2
+    UNDERLINE = 4
+    STRIKETHROUGH = 8
+    SUPERSCRIPT = 16
+    SUBSCRIPT = 32
+    MONOSPACE = 64
 
 
-@dataclass
+def _pack_formatting(formatting: Optional[Iterable[Formatting]]) -> Formatting:
+    """Combine formatting flags into a single Formatting value."""
+    packed = Formatting.NORMAL
+    for flag in formatting or ():
+        packed |= flag
+    return packed
+
+
+# Content dataclasses get __slots__ where the running Python supports it
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Text_Content:
     """Text content with formatting information."""
     text: str
-    formatting: List[Formatting] = field(default_factory=list)
+    formatting: Formatting = Formatting.NORMAL
     font_size: Optional[str] = None
     font_color: Optional[str] = None
     font_family: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """Pack an iterable of formatting flags into one Formatting value."""
+        if not isinstance(self.formatting, Formatting):
+            self.formatting = _pack_formatting(self.formatting)
+
+    @property
+    def line_count(self) -> int:
+        """Get the number of lines in the text."""
+        return self.text.count('\n') + 1
+
+
+class _Content_Mapping:
+    """Read-only mapping access to a content dataclass's fields.
+
+    Lets code written against the older dict-based content keep using
+    ``content['key']`` and ``content.get('key')``.
+    """
+
+    __slots__ = ()
+    __dataclass_fields__: ClassVar[Dict[str, Any]]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field value by name, or default if there is no such field."""
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
+
+    def keys(self) -> List[str]:
+        """Get the field names."""
+        return list(self.__dataclass_fields__)
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Image_Content(_Content_Mapping):
+    """Image content with an optional caption."""
+    path: str
+    caption: Optional[str] = None
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Itemize_Content(_Content_Mapping):
+    """Bullet list content."""
+    items: List[str] = field(default_factory=list)
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Equation_Content(_Content_Mapping):
+    """Equation content as LaTeX source."""
+    latex: str
+    type: str = 'inline'  # 'inline' or 'display'
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Block_Content(_Content_Mapping):
+    """Beamer block content with its parsed nested elements."""
+    type: str = 'block'  # 'block', 'alertblock' or 'exampleblock'
+    title: str = 'Block'
+    elements: List['Universal_Element'] = field(default_factory=list)
+    raw_content: str = ''
+
 
-@dataclass
 class Position:
-    """Position information for elements."""
-    x: float  # Position in inches or cm
-    y: float  # Position in inches or cm
-    width: Optional[float] = None
-    height: Optional[float] = None
+    """
+    Position information for elements.
+
+    x and y are in inches or cm. The four values are stored unboxed in a
+    single array of doubles; width and height may be None, tracked by a
+    small bitmask.
+    """
+
+    __slots__ = ('_xywh', '_unset')
+
+    # Bits in _unset marking a width or height of None
+    _NO_WIDTH = 1
+    _NO_HEIGHT = 2
+
+    def __init__(self, x: float, y: float, width: Optional[float] = None,
+                 height: Optional[float] = None):
+        self._unset = ((self._NO_WIDTH if width is None else 0)
+                       | (self._NO_HEIGHT if height is None else 0))
+        self._xywh = array('d', (x, y,
+                                 0.0 if width is None else width,
+                                 0.0 if height is None else height))
+
+    @property
+    def x(self) -> float:
+        return self._xywh[0]
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._xywh[0] = value
+
+    @property
+    def y(self) -> float:
+        return self._xywh[1]
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._xywh[1] = value
+
+    @property
+    def width(self) -> Optional[float]:
+        return None if self._unset & self._NO_WIDTH else self._xywh[2]
+
+    @width.setter
+    def width(self, value: Optional[float]) -> None:
+        if value is None:
+            self._unset |= self._NO_WIDTH
+            self._xywh[2] = 0.0
+        else:
+            self._unset &= ~self._NO_WIDTH
+            self._xywh[2] = value
+
+    @property
+    def height(self) -> Optional[float]:
+        return None if self._unset & self._NO_HEIGHT else self._xywh[3]
+
+    @height.setter
+    def height(self, value: Optional[float]) -> None:
+        if value is None:
+            self._unset |= self._NO_HEIGHT
+            self._xywh[3] = 0.0
+        else:
+            self._unset &= ~self._NO_HEIGHT
+            self._xywh[3] = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._unset == other._unset and self._xywh == other._xywh
+
+    # Mutable, like the other model dataclasses
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (f"Position(x={self.x!r}, y={self.y!r}, "
+                f"width={self.width!r}, height={self.height!r})")
 
 
 @dataclass
@@ -94,17 +250,48 @@ class Size:
     scale: Optional[float] = None  # Scale factor
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Universal_Element:
     """Universal element that can represent content from any format."""
     element_type: Element_Type
-    content: Union[str, Text_Content, Dict[str, Any]]
+    content: Union[str, Text_Content, Image_Content, Itemize_Content,
+                   Equation_Content, Block_Content, Dict[str, Any]]
     position: Optional[Position] = None
     size: Optional[Size] = None
     level: int = 0  # For nested elements like itemize
     style: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def bulk_create(cls, element_type: Element_Type,
+                    contents: Iterable[Any]) -> List['Universal_Element']:
+        """
+        Create one element of the same type per content item.
+
+        Bypasses the generated __init__ for speed, so every element gets
+        the default position, size, level, style and metadata.
+
+        Args:
+            element_type: Type shared by all created elements
+            contents: Content for each element
+
+        Returns:
+            List of new elements in the order of contents
+        """
+        new = object.__new__
+        elements = []
+        for content in contents:
+            element = new(cls)
+            element.element_type = element_type
+            element.content = content
+            element.position = None
+            element.size = None
+            element.level = 0
+            element.style = {}
+            element.metadata = {}
+            elements.append(element)
+        return elements
+
     def to_text_content(self) -> Optional[Text_Content]:
         """Convert content to Text_Content if possible."""
         if isinstance(self.content, str):
@@ -114,7 +301,7 @@ class Universal_Element:
         return None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Universal_Frame:
     """Universal frame/slide representation."""
     frame_number: int
@@ -130,14 +317,16 @@ class Universal_Frame:
         """Add an element to the frame."""
         self.elements.append(element)
 
-    def get_elements_by_type(self, element_type: Element_Type) -> List[Universal_Element]:
+    def get_elements_by_type(
+            self, element_type: Element_Type) -> List[Universal_Element]:
         """Get all elements of a specific type."""
-        return [elem for elem in self.elements if elem.element_type == element_type]
+        return [elem for elem in self.elements
+                if elem.element_type == element_type]
 
     def get_text_elements(self) -> List[Universal_Element]:
         """Get all text-based elements."""
-        text_types = [Element_Type.TEXT, Element_Type.TITLE, Element_Type.SUBTITLE]
-        return [elem for elem in self.elements if elem.element_type in text_types]
+        return [elem for elem in self.elements
+                if elem.element_type in _TEXT_ELEMENT_TYPES]
 
 
 @dataclass
@@ -156,7 +345,7 @@ class Metadata:
     custom_properties: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Universal_Document:
     """Universal document representation - format-agnostic."""
     metadata: Metadata = field(default_factory=Metadata)
@@ -218,17 +407,21 @@ class Conversion_Options:
 
 # Utility functions for working with universal models
 
-def create_text_element(text: str, element_type: Element_Type = Element_Type.TEXT,
-                       formatting: List[Formatting] = None) -> Universal_Element:
+def create_text_element(
+        text: str, element_type: Element_Type = Element_Type.TEXT,
+        formatting: Optional[Union[Formatting, Iterable[Formatting]]] = None
+) -> Universal_Element:
     """Create a text element with optional formatting."""
-    content = Text_Content(text=text, formatting=formatting or [])
+    if not isinstance(formatting, Formatting):
+        formatting = _pack_formatting(formatting)
+    content = Text_Content(text=text, formatting=formatting)
     return Universal_Element(element_type=element_type, content=content)
 
 
 def create_image_element(image_path: str, caption: str = None,
                         position: Position = None, size: Size = None) -> Universal_Element:
     """Create an image element."""
-    content = {'path': image_path, 'caption': caption}
+    content = Image_Content(path=image_path, caption=caption)
     return Universal_Element(
         element_type=Element_Type.IMAGE,
         content=content,
@@ -239,7 +432,7 @@ def create_image_element(image_path: str, caption: str = None,
 
 def create_itemize_element(items: List[str], level: int = 0) -> Universal_Element:
     """Create an itemize (bullet list) element."""
-    content = {'items': items}
+    content = Itemize_Content(items=items)
     return Universal_Element(
         element_type=Element_Type.ITEMIZE,
         content=content,
@@ -249,27 +442,33 @@ def create_itemize_element(items: List[str], level: int = 0) -> Universal_Elemen
 
 def create_equation_element(latex: str, equation_type: str = 'inline') -> Universal_Element:
     """Create an equation element with LaTeX content."""
-    content = {
-        'latex': latex,
-        'type': equation_type  # 'inline' or 'display'
-    }
+    content = Equation_Content(latex=latex, type=equation_type)
     return Universal_Element(
         element_type=Element_Type.EQUATION,
         content=content
     )
 
 
-def merge_documents(doc1: Universal_Document, doc2: Universal_Document) -> Universal_Document:
-    """Merge two universal documents."""
-    merged = Universal_Document()
-
-    # Merge metadata (doc2 takes precedence)
-    merged.metadata = doc2.metadata or doc1.metadata
-
-    # Merge frames
-    merged.frames = doc1.frames + doc2.frames
+def create_block_element(block_type: str, title: str,
+                         elements: List[Universal_Element],
+                         raw_content: str = '') -> Universal_Element:
+    """Create a Beamer block element with nested elements."""
+    content = Block_Content(type=block_type, title=title, elements=elements,
+                            raw_content=raw_content)
+    return Universal_Element(
+        element_type=Element_Type.BLOCK,
+        content=content
+    )
 
-    # Merge global settings
-    merged.global_settings = {**doc1.global_settings, **doc2.global_settings}
 
-    return merged
+def merge_documents(doc1: Universal_Document, doc2: Universal_Document) -> Universal_Document:
+    """Merge two universal documents."""
+    # Build the merged document in one step, without throwaway defaults
+    return Universal_Document(
+        # Merge metadata (doc2 takes precedence)
+        metadata=doc2.metadata or doc1.metadata,
+        # Merge frames (frames are shared, not copied)
+        frames=[*doc1.frames, *doc2.frames],
+        # Merge global settings
+        global_settings={**doc1.global_settings, **doc2.global_settings}
+    )
@@ -21,32 +21,195 @@
 """LaTeX Beamer parser implementation."""
 
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 
 from ..base import Base_Parser
 from ..models.universal import (
     Universal_Document, Universal_Frame, Universal_Element,
     Metadata, Element_Type, Layout_Type, Text_Content,
-    create_text_element, create_image_element, create_itemize_element, create_equation_element
+    create_text_element, create_image_element, create_itemize_element,
+    create_equation_element, create_block_element
 )
 from ..exceptions import ParseError
 
 
+# Compiled once at import; shared by all parser instances
+# Pattern to match \begin{frame}{optional title} ... \end{frame}
+_FRAME_RE = re.compile(
+    r'\\begin\{frame\}(?:\{([^}]*)\})?\s*'
+    r'(.*?)(?=\\end\{frame\}|\\begin\{frame\}|$)',
+    re.DOTALL | re.IGNORECASE)
+_FRAMETITLE_RE = re.compile(r'\\frametitle\{([^}]+)\}', re.IGNORECASE)
+_ITEM_RE = re.compile(r'\\item\s+(.+)', re.IGNORECASE)
+_INCLUDEGRAPHICS_RE = re.compile(
+    r'\\includegraphics(?:\[[^\]]*\])\{([^}]+)\}', re.IGNORECASE)
+# Equation patterns for inline and display math
+_INLINE_EQ_RE = re.compile(r'\$([^$]+)\$', re.IGNORECASE)
+_EQ_ENV_RE = re.compile(
+    r'\\begin\{equation\*?\}(.*?)\\end\{equation\*?\}',
+    re.DOTALL | re.IGNORECASE)
+_DISPLAY_MATH_RE = re.compile(r'\\\[(.*?)\\\]', re.DOTALL | re.IGNORECASE)
+_ALIGN_ENV_RE = re.compile(
+    r'\\begin\{align\*?\}(.*?)\\end\{align\*?\}', re.DOTALL)
+# Any math in block content; the capture group keeps equations in
+# re.split() output
+_BLOCK_EQ_SPLIT_RE = re.compile(
+    r'(\$\$[^$]+\$|\$[^$]+\$'
+    r'|\\begin\{equation\}.*?\\end\{equation\}'
+    r'|\\begin\{align\}.*?\\end\{align\}'
+    r'|\\begin\{equation\*\}.*?\\end\{equation\*\}'
+    r'|\\begin\{align\*\}.*?\\end\{align\*\})',
+    re.DOTALL)
+# One alternation for the whole block environment family
+_BLOCK_RE = re.compile(r'\\begin{(block|alertblock|exampleblock)}\{([^}]+)\}')
+# Literal forms of the block environments, checked before _BLOCK_RE
+_BLOCK_ENVIRONMENTS = frozenset({'block', 'alertblock', 'exampleblock'})
+_BLOCK_BEGINS = ('\\begin{block}', '\\begin{alertblock}',
+                 '\\begin{exampleblock}')
+# Metadata and section commands in one scan; the lookahead lets matches
+# overlap, so each kind is found as by its own separate search. Only the
+# leading backslash is consumed, which gives the engine a literal to jump
+# between instead of trying the lookahead at every position.
+_DOCUMENT_COMMAND_RE = re.compile(
+    r'\\(?=(title|author|date|documentclass|section)\{([^}]+)\})',
+    re.IGNORECASE)
+_COMMAND_RE = re.compile(r'\\[a-zA-Z]+\*?(?:\[[^\]]*\])?\{[^}]*\}')
+# Frame boundaries; a frame body runs until the next boundary of either kind
+_FRAME_BOUNDARY_RE = re.compile(r'\\(begin|end)\{frame\}', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s*')
+# Matches wherever any of _INCLUDEGRAPHICS_RE, _INLINE_EQ_RE or _FRAMETITLE_RE
+# would, so one scan can rule out all three
+_LINE_MARKUP_RE = re.compile(
+    r'\\includegraphics(?:\[[^\]]*\])\{[^}]+\}'
+    r'|\$[^$]+\$|\\frametitle\{[^}]+\}',
+    re.IGNORECASE)
+
+
+def _strip_commands(line: str) -> str:
+    """Remove LaTeX commands and braces for basic text extraction."""
+    # Every command starts with a backslash; without one there is nothing
+    # for the regex to remove, and braces are plain literal deletions
+    if '\\' in line:
+        line = _COMMAND_RE.sub('', line)
+    return line.replace('{', '').replace('}', '').strip()
+
+
+def _split_inline_math(line: str) -> List[str]:
+    """
+    Split a line into alternating text and inline math parts.
+
+    Like re.split() with a capturing $...$ pattern: even indices are text,
+    odd indices are equation bodies. Dollars escaped with an odd number of
+    backslashes are literal text. One linear str.find scan, no backtracking.
+    """
+    parts = []
+    text_start = 0
+    open_pos = -1
+    pos = line.find('$')
+    while pos != -1:
+        # Count the backslashes directly before this dollar
+        backslashes = 0
+        while pos - backslashes > 0 and line[pos - backslashes - 1] == '\\':
+            backslashes += 1
+        if not backslashes % 2:
+            if open_pos == -1 or pos == open_pos + 1:
+                # Opening dollar; an empty $$ pair reopens at the second one
+                open_pos = pos
+            else:
+                parts.append(line[text_start:open_pos])
+                parts.append(line[open_pos + 1:pos])
+                text_start = pos + 1
+                open_pos = -1
+        pos = line.find('$', pos + 1)
+    parts.append(line[text_start:])
+    return parts
+
+
+def _read_block_begin(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Read (block type, title) from a line starting with a block \\begin.
+
+    The common \\begin{name}{title} form is sliced out with str.find;
+    anything else falls back to _BLOCK_RE. Returns None if neither matches.
+    The block type is interned so it shares identity with the literal tags
+    it is later compared against.
+    """
+    name_start = len('\\begin{')
+    name_end = line.find('}', name_start)
+    if (line[name_start:name_end] in _BLOCK_ENVIRONMENTS
+            and line.startswith('{', name_end + 1)):
+        title_end = line.find('}', name_end + 2)
+        if title_end > name_end + 2:
+            return (sys.intern(line[name_start:name_end]),
+                    line[name_end + 2:title_end])
+    match = _BLOCK_RE.search(line)
+    return (sys.intern(match.group(1)), match.group(2)) if match else None
+
+
+def _iter_frames(content: str) -> Iterator[Tuple[Optional[str], str]]:
+    """
+    Yield (title, body) for each frame in LaTeX content.
+
+    A frame starts at \\begin{frame} with an optional {title} and runs until
+    the next \\begin{frame} or \\end{frame}, or the end of the content. Only
+    the literal boundaries are scanned; bodies are sliced out between them.
+    """
+    boundaries = [
+        (match.group(1).lower() == 'begin', match.start(), match.end())
+        for match in _FRAME_BOUNDARY_RE.finditer(content)]
+    # A trailing newline is not part of an unterminated last frame
+    content_end = len(content) - 1 if content.endswith('\n') else len(content)
+
+    index = 0
+    count = len(boundaries)
+    while index < count:
+        is_begin, _, start = boundaries[index]
+        index += 1
+        if not is_begin:
+            continue
+
+        title = None
+        if content.startswith('{', start):
+            close = content.find('}', start + 1)
+            if close != -1:
+                title = content[start + 1:close]
+                start = close + 1
+        # \s* matches even at the end of the content
+        whitespace = _WHITESPACE_RE.match(content, start)
+        if whitespace:
+            start = whitespace.end()
+
+        # Boundaries swallowed by the title belong to this frame's header
+        while index < count and boundaries[index][1] < start:
+            index += 1
+
+        end = (boundaries[index][1] if index < count
+               else max(start, content_end))
+        yield title, content[start:end]
+
+
 class LaTeX_Parser(Base_Parser):
     """Parser for LaTeX Beamer presentations."""
 
     def __init__(self):
         """Initialize LaTeX parser."""
-        # Pattern to match \begin{frame}{optional title} ... \end{frame}
-        self.frame_pattern = re.compile(r'\\begin\{frame\}(?:\{([^}]*)\})?\s*(.*?)(?=\\end\{frame\}|\\begin\{frame\}|$)', re.DOTALL | re.IGNORECASE)
-        self.title_pattern = re.compile(r'\\frametitle\{([^}]+)\}', re.IGNORECASE)
-        self.itemize_pattern = re.compile(r'\\item\s+(.+)', re.IGNORECASE)
-        self.includegraphics_pattern = re.compile(r'\\includegraphics(?:\[[^\]]*\])\{([^}]+)\}', re.IGNORECASE)
-        # Equation patterns for inline and display math
-        self.inline_equation_pattern = re.compile(r'\$([^$]+)\$', re.IGNORECASE)
-        self.display_equation_pattern = re.compile(r'\\begin\{equation\*?\}(.*?)\\end\{equation\*?\}', re.DOTALL | re.IGNORECASE)
-        self.display_equation_pattern_alt = re.compile(r'\\\[(.*?)\\\]', re.DOTALL | re.IGNORECASE)
+        self.frame_pattern = _FRAME_RE
+        self.title_pattern = _FRAMETITLE_RE
+        self.itemize_pattern = _ITEM_RE
+        self.includegraphics_pattern = _INCLUDEGRAPHICS_RE
+        self.inline_equation_pattern = _INLINE_EQ_RE
+        self.display_equation_pattern = _EQ_ENV_RE
+        self.display_equation_pattern_alt = _DISPLAY_MATH_RE
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear per-document state so one parser can parse many documents."""
+        self.sections: List[str] = []
+        self._document: Optional[Universal_Document] = None
 
     def parse_file(self, filepath: Path, **kwargs) -> Universal_Document:
         """
@@ -68,25 +231,34 @@ class LaTeX_Parser(Base_Parser):
         except UnicodeDecodeError:
             raise ParseError(f"Could not read LaTeX file (encoding issue): {filepath}")
 
-    def parse_string(self, content: str, **kwargs) -> Universal_Document:
-        """Parse LaTeX string into Universal Document format."""
+    def parse_string(self, content: str, workers: int = 1,
+                     **kwargs) -> Universal_Document:
+        """
+        Parse LaTeX string into Universal Document format.
+
+        Args:
+            content: LaTeX source
+            workers: Number of processes to parse frames with; 1 parses
+                in-process
+            **kwargs: Additional parsing options
+
+        Returns:
+            Universal_Document object
+        """
+        # Reset per-document state (sections, document reference)
+        self.reset()
+
         document = Universal_Document()
         document.source_format = 'latex'
 
         # Store document reference for use in other methods
         self._document = document
 
-        # Reset sections for new document
-        self.sections = []
-
-        # Extract metadata
-        self._extract_metadata(content, document)
-
-        # Collect sections for table of contents
-        self._collect_sections(content)
+        # Extract metadata and collect sections for table of contents
+        self._extract_metadata_and_sections(content, document)
 
         # Extract frames
-        frames = self._extract_frames(content, document)
+        frames = self._extract_frames(content, document, workers)
         for frame in frames:
             document.add_frame(frame)
 
@@ -96,58 +268,68 @@ class LaTeX_Parser(Base_Parser):
         """Get supported file extensions."""
         return ['.tex', '.latex']
 
-    def _extract_metadata(self, content: str, document: Universal_Document):
-        """Extract metadata from LaTeX content."""
-        # Extract title
-        title_match = re.search(r'\\title\{([^}]+)\}', content, re.IGNORECASE)
-        if title_match:
-            document.metadata.title = title_match.group(1).strip()
-
-        # Extract author
-        author_match = re.search(r'\\author\{([^}]+)\}', content, re.IGNORECASE)
-        if author_match:
-            document.metadata.author = author_match.group(1).strip()
-
-        # Extract date
-        date_match = re.search(r'\\date\{([^}]+)\}', content, re.IGNORECASE)
-        if date_match:
-            document.metadata.date = date_match.group(1).strip()
-
-        # Extract document class
-        docclass_match = re.search(r'\\documentclass\{([^}]+)\}', content, re.IGNORECASE)
-        if docclass_match:
-            document.metadata.custom_properties['documentclass'] = docclass_match.group(1).strip()
-
-    def _collect_sections(self, content: str):
-        """Collect section information for table of contents."""
-        # Find all sections
-        section_pattern = r'\\section\{([^}]+)\}'
-        matches = re.finditer(section_pattern, content, re.IGNORECASE)
-
-        for match in matches:
+    def _extract_metadata_and_sections(self, content: str,
+                                       document: Universal_Document) -> None:
+        """Extract metadata and collect sections from LaTeX in one scan."""
+        # Keep the first value of each metadata command (title, author, date,
+        # documentclass) and every section in order
+        found: Dict[str, str] = {}
+        section_end = 0
+        for match in _DOCUMENT_COMMAND_RE.finditer(content):
+            command = match.group(1).lower()
+            if command != 'section':
+                found.setdefault(command, match.group(2).strip())
+                continue
+
+            # Sections never overlap each other, as with a plain finditer
+            if match.start() < section_end:
+                continue
+            section_end = match.end(2) + 1
+
             # Unescape LaTeX special characters for display
-            section_title = match.group(1).strip()
+            section_title = match.group(2).strip()
             section_title = section_title.replace(r'\&', '&')
             section_title = section_title.replace(r'\_', '_')
             section_title = section_title.replace(r'\$', '$')
             self.sections.append(section_title)
 
-    def _extract_frames(self, content: str, document: Universal_Document):
+        if 'title' in found:
+            document.metadata.title = found['title']
+        if 'author' in found:
+            document.metadata.author = found['author']
+        if 'date' in found:
+            document.metadata.date = found['date']
+        if 'documentclass' in found:
+            document.metadata.custom_properties['documentclass'] = (
+                found['documentclass'])
+
+    def _extract_frames(self, content: str, document: Universal_Document,
+                        workers: int = 1) -> List[Universal_Frame]:
         """Extract frames from LaTeX content."""
-        frame_matches = self.frame_pattern.finditer(content)
-
-        frame_number = 1
-        frames = []
-        for match in frame_matches:
-            frame_title = match.group(1)  # Title from \begin{frame}{title}
-            frame_content = match.group(2)  # Frame content
-            frame = self._parse_frame(frame_content, frame_number, frame_title)
-            frames.append(frame)
-            frame_number += 1
-
-        return frames
-
-    def _parse_frame(self, frame_content: str, frame_number: int, frame_title: str = None) -> Universal_Frame:
+        frame_contents = []
+        frame_titles = []
+        for frame_title, frame_content in _iter_frames(content):
+            frame_contents.append(frame_content)
+            frame_titles.append(frame_title)
+        frame_numbers = range(1, len(frame_contents) + 1)
+
+        if workers > 1 and len(frame_contents) > 1:
+            # Frames are independent, so they can be parsed in parallel
+            frame_count = len(frame_contents)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(
+                    _parse_single_frame,
+                    frame_contents, frame_numbers, frame_titles,
+                    repeat(self.sections, frame_count),
+                    repeat(document.metadata.title, frame_count),
+                    chunksize=max(1, frame_count // (workers * 4))))
+
+        return [self._parse_frame(frame_content, frame_number, frame_title)
+                for frame_content, frame_number, frame_title
+                in zip(frame_contents, frame_numbers, frame_titles)]
+
+    def _parse_frame(self, frame_content: str, frame_number: int,
+                     frame_title: Optional[str] = None) -> Universal_Frame:
         """Parse a single frame."""
         frame = Universal_Frame(frame_number=frame_number)
 
@@ -166,8 +348,9 @@ class LaTeX_Parser(Base_Parser):
                 if '\\titlepage' in frame_content:
                     frame.layout = Layout_Type.TITLE_SLIDE
                     # Populate with metadata if available
-                    if hasattr(self, '_document') and self._document.metadata.title:
-                        frame.title = self._document.metadata.title
+                    document = self._document
+                    if document is not None and document.metadata.title:
+                        frame.title = document.metadata.title
 
         # Parse elements
         elements = self._parse_elements(frame_content, frame.layout)
@@ -179,7 +362,9 @@ class LaTeX_Parser(Base_Parser):
     def _parse_elements(self, content: str, layout: Layout_Type) -> List[Universal_Element]:
         """Parse elements from frame content."""
         elements = []
-        lines = content.split('\n')
+        # Strip every line once up front; block scanning below reads ahead
+        # through the same list without stripping again
+        lines = [line.strip() for line in content.split('\n')]
 
         current_itemize = []
         in_itemize = False
@@ -188,15 +373,28 @@ class LaTeX_Parser(Base_Parser):
         current_text = []
         skip_until_line = -1  # Skip lines until this line number
 
+        # Bind hot-loop lookups to locals
+        match_item = self.itemize_pattern.match
+        search_image = self.includegraphics_pattern.search
+        search_title = self.title_pattern.search
+        search_markup = _LINE_MARKUP_RE.search
+
         for i, line in enumerate(lines):
             # Skip lines that are part of processed blocks
             if i <= skip_until_line:
                 continue
 
-            line = line.strip()
             if not line or line.startswith('%'):
                 continue
 
+            # Fast path: plain text with no commands or math needs no dispatch
+            if (not in_itemize and not in_equation
+                    and '\\' not in line and '$' not in line):
+                clean_line = line.replace('{', '').replace('}', '').strip()
+                if clean_line:
+                    current_text.append(clean_line)
+                continue
+
             # Skip frametitle commands as they're handled separately
             if line.startswith('\\frametitle'):
                 continue
@@ -205,20 +403,15 @@ class LaTeX_Parser(Base_Parser):
             if line.startswith('\\tableofcontents'):
                 # Create outline element with sections (no bullets - let PowerPoint handle them)
                 if self.sections:
-                    outline_content = '\n'.join([section for section in self.sections])
-                    elements.append(Universal_Element(
-                        element_type=Element_Type.ITEMIZE,
-                        content={'items': self.sections}
-                    ))
+                    elements.append(create_itemize_element(self.sections))
                 continue
 
             # Handle Beamer block environments
-            if line.startswith('\\begin{block}') or line.startswith('\\begin{alertblock}') or line.startswith('\\begin{exampleblock}'):
+            if line.startswith(_BLOCK_BEGINS):
                 # Extract block type and title
-                block_type_match = re.search(r'\\begin{(block|alertblock|exampleblock)}\{([^}]+)\}', line)
-                if block_type_match:
-                    block_type = block_type_match.group(1)
-                    block_title = block_type_match.group(2)
+                block_begin = _read_block_begin(line)
+                if block_begin:
+                    block_type, block_title = block_begin
 
                     # Unescape special characters in title
                     block_title = block_title.replace(r'\&', '&').replace(r'\$', '$').replace(r'\%', '%').replace(r'\_', '_')
@@ -227,12 +420,14 @@ class LaTeX_Parser(Base_Parser):
                     block_title = "Block"
 
                 # Collect block content until \end{block}
+                block_end = f'\\end{{{block_type}}}'
                 block_content_lines = []
                 in_block = True
                 j = i + 1
-                while in_block and j < len(lines):
-                    next_line = lines[j].strip()
-                    if next_line.startswith(f'\\end{{{block_type}}}'):
+                line_count = len(lines)
+                while in_block and j < line_count:
+                    next_line = lines[j]
+                    if next_line.startswith(block_end):
                         in_block = False
                     elif next_line and not next_line.startswith('%'):
                         block_content_lines.append(next_line)
@@ -242,14 +437,12 @@ class LaTeX_Parser(Base_Parser):
                 block_elements = self._parse_block_content(block_content_lines)
 
                 # Create block element with nested elements
-                elements.append(Universal_Element(
-                    element_type=Element_Type.BLOCK,
-                    content={
-                        'type': block_type,  # block, alertblock, exampleblock
-                        'title': block_title,
-                        'elements': block_elements,  # List of parsed elements
-                        'raw_content': ' '.join(block_content_lines) if block_content_lines else ''  # Keep raw content as fallback
-                    }
+                elements.append(create_block_element(
+                    block_type,  # block, alertblock, exampleblock
+                    block_title,
+                    block_elements,  # List of parsed elements
+                    # Keep raw content as fallback
+                    ' '.join(block_content_lines)
                 ))
 
                 # Set skip_until_line to the last line of the block
@@ -257,7 +450,7 @@ class LaTeX_Parser(Base_Parser):
                 continue
 
             # Handle itemize environments
-            if line.startswith('\\begin{itemize}') or line.startswith(r'\begin{itemize}'):
+            if line.startswith('\\begin{itemize}'):
                 # Flush any accumulated text
                 if current_text:
                     text_content = ' '.join(current_text)
@@ -265,7 +458,7 @@ class LaTeX_Parser(Base_Parser):
                     current_text = []
                 in_itemize = True
                 continue
-            elif line.startswith('\\end{itemize}') or line.startswith(r'\end{itemize}'):
+            elif line.startswith('\\end{itemize}'):
                 # Flush any accumulated text
                 if current_text:
                     text_content = ' '.join(current_text)
@@ -277,13 +470,13 @@ class LaTeX_Parser(Base_Parser):
                 in_itemize = False
                 continue
             elif in_itemize:
-                item_match = self.itemize_pattern.match(line)
+                item_match = match_item(line)
                 if item_match:
                     current_itemize.append(item_match.group(1).strip())
                 continue
 
             # Handle multi-line display equations
-            if '\\\\begin{equation}' in line or '\\begin{equation}' in line:
+            if '\\begin{equation}' in line:
                 # Flush any accumulated text
                 if current_text:
                     text_content = ' '.join(current_text)
@@ -293,7 +486,7 @@ class LaTeX_Parser(Base_Parser):
                 equation_lines = []
                 continue
 
-            if '\\\\end{equation}' in line or '\\end{equation}' in line:
+            if '\\end{equation}' in line:
                 if in_equation:
                     equation_content = '\n'.join(equation_lines)
                     equation_text = equation_content.strip()
@@ -307,8 +500,16 @@ class LaTeX_Parser(Base_Parser):
                 equation_lines.append(line)
                 continue
 
+            # Handle text content - accumulate consecutive text lines.
+            # One combined scan rules out images, inline math and frametitles
+            if not search_markup(line):
+                clean_line = _strip_commands(line)
+                if clean_line and not clean_line.startswith('\\'):
+                    current_text.append(clean_line)
+                continue
+
             # Handle includegraphics
-            img_match = self.includegraphics_pattern.search(line)
+            img_match = search_image(line)
             if img_match:
                 # Flush any accumulated text
                 if current_text:
@@ -320,10 +521,9 @@ class LaTeX_Parser(Base_Parser):
                 continue
 
             # Handle inline equations - extract equation but keep surrounding text
-            inline_eq_match = self.inline_equation_pattern.search(line)
-            if inline_eq_match:
-                # Split the line into text and equation parts
-                parts = self.inline_equation_pattern.split(line)
+            # Split the line into text and equation parts
+            parts = _split_inline_math(line)
+            if len(parts) > 1:
                 for i, part in enumerate(parts):
                     if part.strip():  # Non-empty text part
                         if i % 2 == 0:  # Text part
@@ -337,15 +537,12 @@ class LaTeX_Parser(Base_Parser):
                             elements.append(create_equation_element(part.strip(), 'inline'))
                 continue
 
-            # Handle text content - accumulate consecutive text lines
             # Skip frametitle lines since they're already extracted as frame titles
-            if self.title_pattern.search(line):
+            if search_title(line):
                 continue
 
-            # Remove LaTeX commands for basic text extraction
-            clean_line = re.sub(r'\\[a-zA-Z]+\*?(?:\[[^\]]*\])?\{[^}]*\}', '', line)
-            clean_line = re.sub(r'[{}]', '', clean_line).strip()
-
+            # Only escaped dollars matched the prefilter: plain text
+            clean_line = _strip_commands(line)
             if clean_line and not clean_line.startswith('\\'):
                 current_text.append(clean_line)
 
@@ -369,8 +566,7 @@ class LaTeX_Parser(Base_Parser):
             # Handle equations in block content
             if '$' in line or '\\begin{' in line:
                 # Split line by equations and process each part
-                equation_pattern = r'(\$\$[^$]+\$|\$[^$]+\$|\\begin\{equation\}.*?\\end\{equation\}|\\begin\{align\}.*?\\end\{align\}|\\begin\{equation\*\}.*?\\end\{equation\*\}|\\begin\{align\*\}.*?\\end\{align\*\})'
-                parts = re.split(equation_pattern, line, flags=re.DOTALL)
+                parts = _BLOCK_EQ_SPLIT_RE.split(line)
 
                 for i, part in enumerate(parts):
                     if part.strip():
@@ -385,23 +581,18 @@ class LaTeX_Parser(Base_Parser):
                                 eq_content = part.strip().strip('$')
                             elif '\\begin{equation' in part:
                                 eq_type = 'display'
-                                eq_match = re.search(r'\\begin\{equation\*?\}(.*?)\\end\{equation\*?\}', part.strip(), flags=re.DOTALL)
+                                eq_match = _EQ_ENV_RE.search(part.strip())
                                 eq_content = eq_match.group(1).strip() if eq_match else part.strip()
                             elif '\\begin{align' in part:
                                 eq_type = 'display'
-                                eq_match = re.search(r'\\begin\{align\*?\}(.*?)\\end\{align\*?\}', part.strip(), flags=re.DOTALL)
+                                eq_match = _ALIGN_ENV_RE.search(part.strip())
                                 eq_content = eq_match.group(1).strip() if eq_match else part.strip()
                             else:
                                 eq_type = 'inline'
                                 eq_content = part.strip().strip('$')
 
-                            elements.append(Universal_Element(
-                                element_type=Element_Type.EQUATION,
-                                content={
-                                    'latex': eq_content,
-                                    'type': eq_type
-                                }
-                            ))
+                            elements.append(
+                                create_equation_element(eq_content, eq_type))
                         else:
                             # Regular text - add to current text buffer
                             if current_text:
@@ -422,3 +613,14 @@ class LaTeX_Parser(Base_Parser):
                 ))
 
         return elements
+
+
+def _parse_single_frame(frame_content: str, frame_number: int,
+                        frame_title: Optional[str], sections: List[str],
+                        document_title: Optional[str]) -> Universal_Frame:
+    """Parse one frame in a worker process with the document state it uses."""
+    parser = LaTeX_Parser()
+    parser.sections = sections
+    parser._document = Universal_Document(
+        metadata=Metadata(title=document_title))
+    return parser._parse_frame(frame_content, frame_number, frame_title)
@@ -24,7 +24,7 @@ import pytest
 from unittest.mock import Mock, patch
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from src.slideforge.builders.powerpoint_builder import PowerPoint_Builder
+from src.slideforge.builders.powerpoint_builder import PowerPoint_Builder, _pptx
 from src.slideforge.models.universal import Universal_Element, Element_Type
 
 
@@ -97,8 +97,8 @@ class TestPowerPointBuilderBlocks:
 
     def test_block_element_content_dict(self, builder, mock_slide, sample_block_element):
         """Test block element with dictionary content."""
-        with patch('src.slideforge.builders.powerpoint_builder.Inches') as mock_inches, \
-             patch('src.slideforge.builders.powerpoint_builder.RGBColor') as mock_rgb:
+        with patch.object(_pptx(), 'Inches') as mock_inches, \
+             patch.object(_pptx(), 'RGBColor') as mock_rgb:
 
             mock_text_box = Mock()
             mock_text_box.fill = Mock()
@@ -153,8 +153,8 @@ class TestPowerPointBuilderBlocks:
                 }
             )
 
-            with patch('src.slideforge.builders.powerpoint_builder.Inches'), \
-                 patch('src.slideforge.builders.powerpoint_builder.RGBColor') as mock_rgb, \
+            with patch.object(_pptx(), 'Inches'), \
+                 patch.object(_pptx(), 'RGBColor') as mock_rgb, \
                  patch.object(mock_slide.shapes, 'add_textbox') as mock_add_textbox:
 
                 mock_text_box = Mock()
@@ -184,7 +184,7 @@ class TestPowerPointBuilderBlocks:
             content="Simple string content"
         )
 
-        with patch('src.slideforge.builders.powerpoint_builder.Inches'), \
+        with patch.object(_pptx(), 'Inches'), \
              patch.object(mock_slide.shapes, 'add_textbox') as mock_add_textbox:
 
             mock_text_box = Mock()
@@ -209,7 +209,7 @@ class TestPowerPointBuilderBlocks:
 
     def test_block_element_text_formatting(self, builder, mock_slide, sample_block_element):
         """Test that block text gets proper formatting."""
-        with patch('src.slideforge.builders.powerpoint_builder.Inches'), \
+        with patch.object(_pptx(), 'Inches'), \
              patch.object(mock_slide.shapes, 'add_textbox') as mock_add_textbox:
 
             mock_text_box = Mock()
@@ -261,7 +261,7 @@ class TestPowerPointBuilderBlocks:
 
     def test_block_element_margins(self, builder, mock_slide, sample_block_element):
         """Test that block elements have proper margins."""
-        with patch('src.slideforge.builders.powerpoint_builder.Inches') as mock_inches, \
+        with patch.object(_pptx(), 'Inches') as mock_inches, \
              patch.object(mock_slide.shapes, 'add_textbox') as mock_add_textbox:
 
             mock_text_box = Mock()
@@ -300,7 +300,7 @@ class TestPowerPointBuilderBlocks:
             }
         )
 
-        with patch('src.slideforge.builders.powerpoint_builder.Inches'), \
+        with patch.object(_pptx(), 'Inches'), \
              patch.object(builder, '_render_latex_equation') as mock_render_eq, \
              patch.object(mock_slide.shapes, 'add_textbox') as mock_add_textbox:
 
@@ -350,7 +350,7 @@ class TestPowerPointBuilderBlocks:
             }
         )
 
-        with patch('src.slideforge.builders.powerpoint_builder.Inches'), \
+        with patch.object(_pptx(), 'Inches'), \
              patch.object(builder, '_render_latex_equation') as mock_render_eq, \
              patch.object(mock_slide.shapes, 'add_textbox') as mock_add_textbox:
 
@@ -398,7 +398,7 @@ class TestPowerPointBuilderBlocks:
             }
         )
 
-        with patch('src.slideforge.builders.powerpoint_builder.Inches'), \
+        with patch.object(_pptx(), 'Inches'), \
              patch.object(builder, '_render_latex_equation') as mock_render_eq, \
              patch.object(mock_slide.shapes, 'add_textbox') as mock_add_textbox:
 
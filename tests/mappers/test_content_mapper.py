@@ -24,65 +24,67 @@ import pytest
 from slideforge.mappers.content_mapper import Content_Mapper
 from slideforge.models.universal import (
     Universal_Document, Universal_Frame, Universal_Element,
-    Element_Type, Layout_Type, Position
+    Element_Type, Layout_Type, Position, Text_Content
 )
 
 
-class TestContentMapper:
-    """Test cases for content mapper."""
-
-    @pytest.fixture
-    def mapper(self):
-        """Create content mapper instance."""
-        return Content_Mapper()
-
-    @pytest.fixture
-    def sample_document(self):
-        """Create sample universal document."""
-        doc = Universal_Document()
-
-        # Add frames with different layouts
-        frame1 = Universal_Frame(
-            frame_number=1,
-            title="Title Slide",
-            elements=[],
-            layout=Layout_Type.TITLE_SLIDE
-        )
-
-        frame2 = Universal_Frame(
-            frame_number=2,
-            title="Content Slide",
-            elements=[
-                Universal_Element(
-                    element_type=Element_Type.TEXT,
-                    content="This is some text content"
-                ),
-                Universal_Element(
-                    element_type=Element_Type.ITEMIZE,
-                    content={'items': ['Item 1', 'Item 2', 'Item 3']}
-                )
-            ],
-            layout=Layout_Type.TITLE_AND_CONTENT
-        )
+@pytest.fixture(scope="module")
+def mapper():
+    """Create content mapper instance."""
+    return Content_Mapper()
+
+
+@pytest.fixture(scope="module")
+def sample_document():
+    """Create sample universal document, shared read-only across the module."""
+    doc = Universal_Document()
+
+    # Add frames with different layouts
+    frame1 = Universal_Frame(
+        frame_number=1,
+        title="Title Slide",
+        elements=[],
+        layout=Layout_Type.TITLE_SLIDE
+    )
+
+    frame2 = Universal_Frame(
+        frame_number=2,
+        title="Content Slide",
+        elements=[
+            Universal_Element(
+                element_type=Element_Type.TEXT,
+                content="This is some text content"
+            ),
+            Universal_Element(
+                element_type=Element_Type.ITEMIZE,
+                content={'items': ['Item 1', 'Item 2', 'Item 3']}
+            )
+        ],
+        layout=Layout_Type.TITLE_AND_CONTENT
+    )
+
+    frame3 = Universal_Frame(
+        frame_number=3,
+        title="Two Column Slide",
+        elements=[
+            Universal_Element(
+                element_type=Element_Type.TEXT,
+                content="Left column content"
+            ),
+            Universal_Element(
+                element_type=Element_Type.TEXT,
+                content="Right column content"
+            )
+        ],
+        layout=Layout_Type.TWO_COLUMN
+    )
+
+    doc.frames = [frame1, frame2, frame3]
+    return doc
 
-        frame3 = Universal_Frame(
-            frame_number=3,
-            title="Two Column Slide",
-            elements=[
-                Universal_Element(
-                    element_type=Element_Type.TEXT,
-                    content="Left column content"
-                ),
-                Universal_Element(
-                    element_type=Element_Type.TEXT,
-                    content="Right column content"
-                )
-            ],
-            layout=Layout_Type.TWO_COLUMN
-        )
 
-        doc.frames = [frame1, frame2, frame3]
-        return doc
+class TestContentMapper:
+    """Test cases for content mapper."""
 
     def test_get_supported_conversions(self, mapper):
         """Test supported conversion mappings."""
@@ -255,6 +257,12 @@ class TestContentMapper:
         height3 = mapper._estimate_text_height("", 8.0)
         assert height3 >= 0.3  # Minimum height
 
+    def test_estimate_text_height_text_content(self, mapper):
+        """Test text height estimation for Text_Content."""
+        height = mapper._estimate_text_height(
+            Text_Content(text="Line 1\nLine 2\nLine 3"), 8.0)
+        assert height == pytest.approx(0.9)  # 3 lines * 0.3 each
+
     def test_estimate_itemize_height(self, mapper):
         """Test itemize height estimation."""
         # Single item
@@ -292,11 +300,12 @@ class TestContentMapper:
     def test_preserve_element_metadata(self, mapper, sample_document):
         """Test that element metadata is preserved during mapping."""
         result = mapper.map_document(sample_document, 'pptx')
+        mapped_by_number = {f.frame_number: f for f in result}
 
         for original_frame in sample_document.frames:
+            mapped_frame = mapped_by_number[original_frame.frame_number]
             for original_element in original_frame.elements:
                 # Find corresponding element in mapped frame
-                mapped_frame = next(f for f in result if f.frame_number == original_frame.frame_number)
                 mapped_element = next(e for e in mapped_frame.elements if e.content == original_element.content)
 
                 assert mapped_element.element_type == original_element.element_type
@@ -23,10 +23,10 @@
 import pytest
 from slideforge.models.universal import (
     Universal_Document, Universal_Frame, Universal_Element,
-    Element_Type, Layout_Type, Formatting, Text_Content,
+    Element_Type, Layout_Type, Formatting, Text_Content, Image_Content,
     Position, Size, Conversion_Options,
     create_text_element, create_image_element, create_itemize_element, create_equation_element,
-    merge_documents
+    create_block_element, merge_documents
 )
 
 
@@ -113,6 +113,32 @@ class TestUniversalModels:
         assert len(itemize_elements) == 1
         assert len(itemize_elements[0].content['items']) == 2
 
+    def test_get_elements_by_type_from_constructor(self):
+        """Test that elements passed to the constructor are found by type."""
+        text_elem = create_text_element("Text content")
+        image_elem = create_image_element("test.png")
+        frame = Universal_Frame(
+            frame_number=1, elements=[text_elem, image_elem])
+
+        assert frame.get_elements_by_type(Element_Type.TEXT) == [text_elem]
+        assert frame.get_elements_by_type(Element_Type.IMAGE) == [image_elem]
+        assert frame.get_elements_by_type(Element_Type.TABLE) == []
+
+    def test_get_elements_by_type_after_in_place_changes(self):
+        """Test filtering sees elements replaced or removed in place."""
+        text_elem = create_text_element("Text content")
+        image_elem = create_image_element("test.png")
+        frame = Universal_Frame(frame_number=1, elements=[text_elem])
+
+        frame.elements[0] = image_elem
+        assert frame.get_elements_by_type(Element_Type.TEXT) == []
+        assert frame.get_elements_by_type(Element_Type.IMAGE) == [image_elem]
+
+        frame.elements.remove(image_elem)
+        frame.add_element(text_elem)
+        assert frame.get_elements_by_type(Element_Type.TEXT) == [text_elem]
+        assert frame.get_elements_by_type(Element_Type.IMAGE) == []
+
     def test_get_text_elements(self):
         """Test getting all text-based elements."""
         frame = Universal_Frame(frame_number=1)
@@ -157,6 +183,19 @@ class TestUniversalModels:
         assert element.style["bold"] is True
         assert element.metadata["custom"] == "data"
 
+    def test_universal_element_bulk_create(self):
+        """Test Universal_Element.bulk_create matches regular construction."""
+        elements = Universal_Element.bulk_create(
+            Element_Type.TEXT, ["First", "Second"])
+
+        assert elements == [
+            Universal_Element(element_type=Element_Type.TEXT, content="First"),
+            Universal_Element(element_type=Element_Type.TEXT, content="Second")
+        ]
+        # Each element gets its own mutable defaults
+        elements[0].metadata["custom"] = "data"
+        assert elements[1].metadata == {}
+
     def test_text_content_creation(self):
         """Test Text_Content creation."""
         text_content = Text_Content(
@@ -169,9 +208,19 @@ class TestUniversalModels:
         assert text_content.text == "Sample text"
         assert Formatting.BOLD in text_content.formatting
         assert Formatting.ITALIC in text_content.formatting
+        assert Formatting.UNDERLINE not in text_content.formatting
+        assert text_content.formatting == Formatting.BOLD | Formatting.ITALIC
         assert text_content.font_size == 14
         assert text_content.font_color == "#FF0000"
 
+    def test_text_content_line_count(self):
+        """Test Text_Content line count tracks the current text."""
+        text_content = Text_Content(text="Line 1\nLine 2")
+        assert text_content.line_count == 2
+
+        text_content.text = "Line 1\nLine 2\nLine 3"
+        assert text_content.line_count == 3
+
     def test_position_creation(self):
         """Test Position creation."""
         position = Position(x=1.5, y=2.5, width=8.5, height=1.5)
@@ -188,6 +237,19 @@ class TestUniversalModels:
         assert position_minimal.width is None
         assert position_minimal.height is None
 
+    def test_position_update_and_equality(self):
+        """Test Position field updates and equality."""
+        position = Position(x=1.0, y=2.0)
+        position.width = 8.0
+        position.height = 1.0
+
+        assert position == Position(x=1.0, y=2.0, width=8.0, height=1.0)
+        assert position != Position(x=1.0, y=2.0, width=8.0)
+
+        position.height = None
+        assert position.height is None
+        assert position == Position(x=1.0, y=2.0, width=8.0)
+
     def test_size_creation(self):
         """Test Size creation."""
         size = Size(width=10.0, height=6.0, scale=1.5)
@@ -231,6 +293,16 @@ class TestUniversalModels:
         assert options.output_format == "pptx"
         assert options.custom_settings["theme"] == "professional"
 
+    def test_conversion_options_custom_settings_mutable(self):
+        """Test custom settings can be set in place on default options."""
+        options = Conversion_Options()
+        options.custom_settings["theme"] = "professional"
+
+        assert options.to_dict()["custom_settings"] == {
+            "theme": "professional"}
+        # Each instance gets its own settings dict
+        assert Conversion_Options().custom_settings == {}
+
     def test_create_text_element(self):
         """Test create_text_element utility function."""
         element = create_text_element("Test text")
@@ -238,7 +310,7 @@ class TestUniversalModels:
         assert element.element_type == Element_Type.TEXT
         assert isinstance(element.content, Text_Content)
         assert element.content.text == "Test text"
-        assert element.content.formatting == []
+        assert element.content.formatting == Formatting.NORMAL
 
     def test_create_text_element_with_formatting(self):
         """Test create_text_element with formatting."""
@@ -247,7 +319,8 @@ class TestUniversalModels:
             formatting=[Formatting.BOLD, Formatting.ITALIC]
         )
 
-        assert element.content.formatting == [Formatting.BOLD, Formatting.ITALIC]
+        assert element.content.formatting == (
+            Formatting.BOLD | Formatting.ITALIC)
 
     def test_create_text_element_different_type(self):
         """Test create_text_element with different element type."""
@@ -264,6 +337,18 @@ class TestUniversalModels:
         assert element.content['path'] == "test.png"
         assert element.content['caption'] == "Test caption"
 
+    def test_typed_content_mapping_access(self):
+        """Test typed content supports dict-style access to its fields."""
+        content = Image_Content(path="test.png")
+
+        assert content.path == "test.png"
+        assert content['caption'] is None
+        assert 'path' in content
+        assert 'width' not in content
+        assert content.get('width', 'default') == 'default'
+        with pytest.raises(KeyError):
+            content['width']
+
     def test_create_image_element_with_position(self):
         """Test create_image_element with position and size."""
         position = Position(x=1.0, y=2.0)
@@ -304,6 +389,20 @@ class TestUniversalModels:
         assert element.content['latex'] == "\\int_{-\\infty}^{\\infty} e^{-x^2} dx = \\sqrt{\\pi}"
         assert element.content['type'] == 'display'
 
+    def test_create_block_element(self):
+        """Test create_block_element utility function."""
+        nested = [create_text_element("Block text")]
+        element = create_block_element(
+            "alertblock", "Warning", nested, "Block text")
+
+        assert element.element_type == Element_Type.BLOCK
+        assert element.content['type'] == 'alertblock'
+        assert element.content['title'] == 'Warning'
+        assert element.content['elements'] == nested
+        assert element.content['raw_content'] == "Block text"
+        assert set(element.content.keys()) == {
+            'type', 'title', 'elements', 'raw_content'}
+
     def test_merge_documents(self):
         """Test merge_documents utility function."""
         doc1 = Universal_Document()
@@ -343,7 +442,7 @@ class TestUniversalModels:
         element2 = Universal_Element(Element_Type.TEXT, text_content)
         text_content2 = element2.to_text_content()
         assert text_content2.text == "Formatted text"
-        assert text_content2.formatting == [Formatting.BOLD]
+        assert text_content2.formatting == Formatting.BOLD
 
         # Test with incompatible content
         element3 = Universal_Element(Element_Type.IMAGE, {"path": "test.png"})
@@ -379,11 +478,11 @@ class TestUniversalModels:
 
     def test_formatting_values(self):
         """Test Formatting enum values."""
-        assert Formatting.BOLD.value == "bold"
-        assert Formatting.ITALIC.value == "italic"
-        assert Formatting.UNDERLINE.value == "underline"
-        assert Formatting.STRIKETHROUGH.value == "strikethrough"
-        assert Formatting.SUPERSCRIPT.value == "superscript"
-        assert Formatting.SUBSCRIPT.value == "subscript"
-        assert Formatting.MONOSPACE.value == "monospace"
-        assert Formatting.NORMAL.value == "normal"
+        assert Formatting.BOLD.value == 1
+        assert Formatting.ITALIC.value == 2
+        assert Formatting.UNDERLINE.value == 4
+        assert Formatting.STRIKETHROUGH.value == 8
+        assert Formatting.SUPERSCRIPT.value == 16
+        assert Formatting.SUBSCRIPT.value == 32
+        assert Formatting.MONOSPACE.value == 64
+        assert Formatting.NORMAL.value == 0
@@ -0,0 +1,111 @@
+# Copyright (c) 2026 Slide Forge Team
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Shared fixtures for parser tests."""
+
+import functools
+import json
+from pathlib import Path
+from typing import Union
+
+import pytest
+
+from slideforge.parsers.latex_parser import LaTeX_Parser
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Create one LaTeX parser instance shared by all parser tests."""
+    return LaTeX_Parser()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(parser):
+    """Parse a tiny document once so one-off setup costs precede the tests."""
+    parser.parse_string(r"\begin{frame}{w}\end{frame}")
+
+
+@pytest.fixture(autouse=True)
+def _reset_parser(parser):
+    """Clear the shared parser's per-document state before each test."""
+    parser.reset()
+
+
+_TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+# Manifest categories covered by the data-driven tests
+MANIFEST_CATEGORIES = [
+    "basic", "equations", "formatting", "complex", "edge_cases"]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_manifest() -> dict:
+    """Load the test manifest, reading the file once per session."""
+    with open(_TEST_DATA_DIR / "test_manifest.json", 'r') as f:
+        return json.load(f)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize category/test_case tests with one case per manifest file."""
+    if {"category", "test_case"} <= set(metafunc.fixturenames):
+        manifest = _load_manifest()
+        cases = [(category, test_case)
+                 for category in MANIFEST_CATEGORIES
+                 for test_case in manifest.get(category, [])]
+        ids = [f"{category}-{test_case['file']}"
+               for category, test_case in cases]
+        metafunc.parametrize("category,test_case", cases, ids=ids)
+
+
+@pytest.fixture(scope="session")
+def test_data_dir():
+    """Get test data directory."""
+    return _TEST_DATA_DIR
+
+
+@pytest.fixture(scope="session")
+def test_manifest():
+    """Get the test manifest."""
+    return _load_manifest()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_latex(path: Union[str, Path]) -> str:
+    """Read a LaTeX fixture file in one call, caching contents by path."""
+    with open(path, 'rb') as f:
+        return f.read().decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def read_latex():
+    """Get the cached LaTeX fixture file reader."""
+    return _read_latex
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_latex(parser: LaTeX_Parser, latex_content: str, source_path: str):
+    """Parse LaTeX content, caching documents by parser, content and path."""
+    return parser.parse_string(latex_content, source_path=source_path)
+
+
+@pytest.fixture(scope="session")
+def parse_latex(parser):
+    """Get a parse function that reuses documents from identical parses."""
+    return functools.partial(_parse_latex, parser)
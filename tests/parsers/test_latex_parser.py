@@ -22,18 +22,80 @@
 
 import pytest
 from pathlib import Path
-from slideforge.parsers.latex_parser import LaTeX_Parser
 from slideforge.models.universal import Element_Type, Layout_Type
 
 
+# Frame-level fragments parsed together as one suite document
+_SUITE_FRAGMENTS = {
+    'itemize': r"""
+\begin{frame}{List Test}
+    \begin{itemize}
+        \item First bullet point
+        \item Second bullet point
+        \item Third bullet point
+    \end{itemize}
+\end{frame}
+""",
+    'inline_equations': r"""
+\begin{frame}{Equation Test}
+    Einstein's equation: $E = mc^2$
+    Pythagorean theorem: $a^2 + b^2 = c^2$
+\end{frame}
+""",
+    'escaped_dollars': r"""
+\begin{frame}{Escaped Dollars}
+    Price: \$5 and \$10
+\end{frame}
+""",
+    'display_equations': r"""
+\begin{frame}{Display Equations}
+    Gaussian integral:
+    \begin{equation}
+        \int_{-\infty}^{\infty} e^{-x^2} dx = \sqrt{\pi}
+    \end{equation}
+\end{frame}
+""",
+    'mixed_content': r"""
+\begin{frame}{Mixed Content}
+    Some text content.
+
+    \begin{itemize}
+        \item List item with equation: $x^2 + y^2 = z^2$
+        \item Another item
+    \end{itemize}
+
+    Final equation:
+    \begin{equation}
+        \sum_{i=1}^{n} i = \frac{n(n+1)}{2}
+    \end{equation}
+\end{frame}
+""",
+    'empty_frame': r"""
+\begin{frame}{Empty Frame}
+\end{frame}
+""",
+    'frametitle_duplicates': r"""
+\begin{frame}{Frame Title}
+    This should be the only text element.
+    \frametitle{Frame Title}
+    This should not create duplicate text.
+\end{frame}
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def suite_frames(parser):
+    """Parse all suite fragments in one pass and map each name to its frame."""
+    document = parser.parse_string(
+        '\n'.join(_SUITE_FRAGMENTS.values()), source_path='test.tex')
+    assert len(document.frames) == len(_SUITE_FRAGMENTS)
+    return dict(zip(_SUITE_FRAGMENTS, document.frames))
+
+
 class TestLatexParser:
     """Test cases for LaTeX Beamer parser."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create LaTeX parser instance."""
-        return LaTeX_Parser()
-
     @pytest.fixture
     def sample_latex_content(self):
         """Sample LaTeX content for testing."""
@@ -86,23 +148,12 @@ class TestLatexParser:
         assert element.element_type == Element_Type.TEXT
         assert 'This is test content.' in element.content.text
 
-    def test_parse_itemize_list(self, parser):
+    def test_parse_itemize_list(self, suite_frames):
         """Test parsing itemize (bullet) lists."""
-        latex_content = r"""
-\begin{frame}{List Test}
-    \begin{itemize}
-        \item First bullet point
-        \item Second bullet point
-        \item Third bullet point
-    \end{itemize}
-\end{frame}
-"""
-
-        document = parser.parse_string(latex_content, source_path='test.tex')
-        frame = document.frames[0]
+        frame = suite_frames['itemize']
 
         # Should have one itemize element
-        itemize_elements = [e for e in frame.elements if e.element_type == Element_Type.ITEMIZE]
+        itemize_elements = frame.get_elements_by_type(Element_Type.ITEMIZE)
         assert len(itemize_elements) == 1
 
         itemize = itemize_elements[0]
@@ -112,20 +163,12 @@ class TestLatexParser:
         assert 'Second bullet point' in items[1]
         assert 'Third bullet point' in items[2]
 
-    def test_parse_inline_equations(self, parser):
+    def test_parse_inline_equations(self, suite_frames):
         """Test parsing inline equations."""
-        latex_content = r"""
-\begin{frame}{Equation Test}
-    Einstein's equation: $E = mc^2$
-    Pythagorean theorem: $a^2 + b^2 = c^2$
-\end{frame}
-"""
-
-        document = parser.parse_string(latex_content, source_path='test.tex')
-        frame = document.frames[0]
+        frame = suite_frames['inline_equations']
 
         # Should have two equation elements
-        equation_elements = [e for e in frame.elements if e.element_type == Element_Type.EQUATION]
+        equation_elements = frame.get_elements_by_type(Element_Type.EQUATION)
         assert len(equation_elements) == 2
 
         # Check first equation
@@ -138,22 +181,21 @@ class TestLatexParser:
         assert eq2.content['latex'] == 'a^2 + b^2 = c^2'
         assert eq2.content['type'] == 'inline'
 
-    def test_parse_display_equations(self, parser):
-        """Test parsing display equations."""
-        latex_content = r"""
-\begin{frame}{Display Equations}
-    Gaussian integral:
-    \begin{equation}
-        \int_{-\infty}^{\infty} e^{-x^2} dx = \sqrt{\pi}
-    \end{equation}
-\end{frame}
-"""
+    def test_escaped_dollars_are_text(self, suite_frames):
+        """Test that escaped dollars do not start inline equations."""
+        frame = suite_frames['escaped_dollars']
 
-        document = parser.parse_string(latex_content, source_path='test.tex')
-        frame = document.frames[0]
+        assert frame.get_elements_by_type(Element_Type.EQUATION) == []
+        text_elements = frame.get_elements_by_type(Element_Type.TEXT)
+        assert len(text_elements) == 1
+        assert 'Price: \\$5 and \\$10' in text_elements[0].content.text
+
+    def test_parse_display_equations(self, suite_frames):
+        """Test parsing display equations."""
+        frame = suite_frames['display_equations']
 
         # Should have one equation element
-        equation_elements = [e for e in frame.elements if e.element_type == Element_Type.EQUATION]
+        equation_elements = frame.get_elements_by_type(Element_Type.EQUATION)
         assert len(equation_elements) == 1
 
         equation = equation_elements[0]
@@ -161,45 +203,22 @@ class TestLatexParser:
         assert '\\sqrt' in equation.content['latex']
         assert equation.content['type'] == 'display'
 
-    def test_parse_mixed_content(self, parser):
+    def test_parse_mixed_content(self, suite_frames):
         """Test parsing mixed content types."""
-        latex_content = r"""
-\begin{frame}{Mixed Content}
-    Some text content.
-
-    \begin{itemize}
-        \item List item with equation: $x^2 + y^2 = z^2$
-        \item Another item
-    \end{itemize}
-
-    Final equation:
-    \begin{equation}
-        \sum_{i=1}^{n} i = \frac{n(n+1)}{2}
-    \end{equation}
-\end{frame}
-"""
-
-        document = parser.parse_string(latex_content, source_path='test.tex')
-        frame = document.frames[0]
+        frame = suite_frames['mixed_content']
 
         # Should have text, itemize, and equation elements
-        text_elements = [e for e in frame.elements if e.element_type == Element_Type.TEXT]
-        itemize_elements = [e for e in frame.elements if e.element_type == Element_Type.ITEMIZE]
-        equation_elements = [e for e in frame.elements if e.element_type == Element_Type.EQUATION]
+        text_elements = frame.get_elements_by_type(Element_Type.TEXT)
+        itemize_elements = frame.get_elements_by_type(Element_Type.ITEMIZE)
+        equation_elements = frame.get_elements_by_type(Element_Type.EQUATION)
 
         assert len(text_elements) >= 1
         assert len(itemize_elements) == 1
         assert len(equation_elements) == 1
 
-    def test_parse_empty_frame(self, parser):
+    def test_parse_empty_frame(self, suite_frames):
         """Test parsing empty frame."""
-        latex_content = r"""
-\begin{frame}{Empty Frame}
-\end{frame}
-"""
-
-        document = parser.parse_string(latex_content, source_path='test.tex')
-        frame = document.frames[0]
+        frame = suite_frames['empty_frame']
 
         assert frame.title == 'Empty Frame'
         assert len(frame.elements) == 0
@@ -243,25 +262,26 @@ class TestLatexParser:
         assert document.metadata.author == 'John Doe'
         assert document.metadata.date == 'January 2026'
 
-    def test_skip_frametitle_duplicates(self, parser):
+    def test_skip_frametitle_duplicates(self, suite_frames):
         """Test that frametitle doesn't appear as regular text."""
-        latex_content = r"""
-\begin{frame}{Frame Title}
-    This should be the only text element.
-    \frametitle{Frame Title}
-    This should not create duplicate text.
-\end{frame}
-"""
-
-        document = parser.parse_string(latex_content, source_path='test.tex')
-        frame = document.frames[0]
+        frame = suite_frames['frametitle_duplicates']
 
-        text_elements = [e for e in frame.elements if e.element_type == Element_Type.TEXT]
+        text_elements = frame.get_elements_by_type(Element_Type.TEXT)
         # Should only have one text element (not counting the frametitle)
         assert len(text_elements) == 1
         assert 'This should be the only text element.' in text_elements[0].content.text
         assert 'This should not create duplicate text.' in text_elements[0].content.text
 
+    def test_parse_with_workers_matches_serial(self, parser):
+        """Test that parsing frames in worker processes gives equal frames."""
+        latex_content = '\n'.join(_SUITE_FRAGMENTS.values())
+
+        serial = parser.parse_string(latex_content, source_path='test.tex')
+        parallel = parser.parse_string(
+            latex_content, source_path='test.tex', workers=4)
+
+        assert parallel.frames == serial.frames
+
     def test_get_supported_extensions(self, parser):
         """Test supported file extensions."""
         extensions = parser.get_supported_extensions()
@@ -20,19 +20,12 @@
 
 """Unit tests for LaTeX parser block environment support."""
 
-import pytest
-from src.slideforge.parsers.latex_parser import LaTeX_Parser
-from src.slideforge.models.universal import Element_Type
+from slideforge.models.universal import Element_Type
 
 
 class TestLaTeXParserBlocks:
     """Test LaTeX parser block environment functionality."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a LaTeX parser instance."""
-        return LaTeX_Parser()
-
     def test_basic_block_parsing(self, parser):
         """Test parsing a basic block environment."""
         latex_content = r"""
@@ -47,7 +40,7 @@ class TestLaTeXParserBlocks:
         frame = document.frames[0]
 
         # Should have one block element
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
         assert len(block_elements) == 1
 
         block = block_elements[0]
@@ -69,7 +62,7 @@ class TestLaTeXParserBlocks:
         frame = document.frames[0]
 
         # Should have one block element
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
         assert len(block_elements) == 1
 
         block = block_elements[0]
@@ -91,7 +84,7 @@ class TestLaTeXParserBlocks:
         frame = document.frames[0]
 
         # Should have one block element
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
         assert len(block_elements) == 1
 
         block = block_elements[0]
@@ -121,14 +114,12 @@ class TestLaTeXParserBlocks:
         frame = document.frames[0]
 
         # Should have three block elements
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
         assert len(block_elements) == 3
 
         # Check each block type
-        block_types = [block.content['type'] for block in block_elements]
-        assert 'block' in block_types
-        assert 'alertblock' in block_types
-        assert 'exampleblock' in block_types
+        block_types = {block.content['type'] for block in block_elements}
+        assert block_types == {'block', 'alertblock', 'exampleblock'}
 
     def test_block_with_special_characters(self, parser):
         """Test parsing blocks with special characters."""
@@ -143,7 +134,7 @@ class TestLaTeXParserBlocks:
         document = parser.parse_string(latex_content)
         frame = document.frames[0]
 
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
         assert len(block_elements) == 1
 
         block = block_elements[0]
@@ -165,7 +156,7 @@ class TestLaTeXParserBlocks:
         document = parser.parse_string(latex_content)
         frame = document.frames[0]
 
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
         assert len(block_elements) == 1
 
         block = block_elements[0]
@@ -186,7 +177,7 @@ class TestLaTeXParserBlocks:
         document = parser.parse_string(latex_content)
         frame = document.frames[0]
 
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
         assert len(block_elements) == 1
 
         block = block_elements[0]
@@ -216,9 +207,9 @@ class TestLaTeXParserBlocks:
         frame = document.frames[0]
 
         # Should have text, block, and itemize elements
-        text_elements = [e for e in frame.elements if e.element_type == Element_Type.TEXT]
-        block_elements = [e for e in frame.elements if e.element_type == Element_Type.BLOCK]
-        itemize_elements = [e for e in frame.elements if e.element_type == Element_Type.ITEMIZE]
+        text_elements = frame.get_elements_by_type(Element_Type.TEXT)
+        block_elements = frame.get_elements_by_type(Element_Type.BLOCK)
+        itemize_elements = frame.get_elements_by_type(Element_Type.ITEMIZE)
 
         assert len(text_elements) >= 1
         assert len(block_elements) == 1
@@ -25,19 +25,12 @@ Failing test for itemize inline equation parsing.
 This test documents a known limitation that should be fixed later.
 """
 
-import pytest
-from slideforge.parsers.latex_parser import LaTeX_Parser
 from slideforge.models.universal import Element_Type
 
 
 class TestItemizeInlineEquations:
     """Test inline equations within itemize lists."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create LaTeX parser instance."""
-        return LaTeX_Parser()
-
     def test_itemize_with_inline_equations(self, parser):
         """
         Test that inline equations within itemize items are properly extracted.
@@ -106,7 +99,7 @@ class TestItemizeInlineEquations:
         frame = document.frames[0]
 
         # Current behavior: Everything is treated as plain text in the itemize
-        itemize_elements = [e for e in frame.elements if e.element_type == Element_Type.ITEMIZE]
+        itemize_elements = frame.get_elements_by_type(Element_Type.ITEMIZE)
         assert len(itemize_elements) == 1
 
         # Expected behavior (when implemented):
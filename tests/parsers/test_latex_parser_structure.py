@@ -20,23 +20,10 @@
 
 """Tests for LaTeX parser structural functionality."""
 
-import pytest
-from pathlib import Path
-from slideforge.parsers.latex_parser import LaTeX_Parser
 from slideforge.models.universal import Layout_Type, Element_Type
 
 
-class TestLaTeXParserStructure:
-    """Test cases for LaTeX parser structural features."""
-
-    @pytest.fixture
-    def parser(self):
-        """Create LaTeX parser instance."""
-        return LaTeX_Parser()
-
-    def test_title_slide_detection(self, parser):
-        """Test that title slides are properly detected from \\titlepage."""
-        latex_content = r"""
+_TEX_TITLE_SLIDE = r"""
 \documentclass{beamer}
 \title{Test Presentation}
 \author{Test Author}
@@ -53,24 +40,7 @@ Some content here
 \end{document}
 """
 
-        document = parser.parse_string(latex_content)
-
-        # Should have 2 frames
-        assert len(document.frames) == 2
-
-        # First frame should be title slide
-        title_frame = document.frames[0]
-        assert title_frame.layout == Layout_Type.TITLE_SLIDE
-        assert title_frame.title == "Test Presentation"
-
-        # Second frame should be regular slide
-        content_frame = document.frames[1]
-        assert content_frame.layout == Layout_Type.TITLE_AND_CONTENT
-        assert content_frame.title == "Regular Slide"
-
-    def test_table_of_contents_generation(self, parser):
-        """Test that table of contents is properly generated."""
-        latex_content = r"""
+_TEX_TOC = r"""
 \documentclass{beamer}
 \title{Test Presentation}
 \author{Test Author}
@@ -87,27 +57,7 @@ Some content here
 \end{document}
 """
 
-        document = parser.parse_string(latex_content)
-
-        # Should collect sections
-        assert len(parser.sections) == 4
-        assert "Introduction" in parser.sections
-        assert "Methods" in parser.sections
-        assert "Results" in parser.sections
-        assert "Conclusion" in parser.sections
-
-        # Should have outline frame with table of contents
-        outline_frame = document.frames[0]
-        assert outline_frame.title == "Outline"
-        assert len(outline_frame.elements) == 1
-
-        toc_element = outline_frame.elements[0]
-        assert toc_element.element_type == Element_Type.ITEMIZE
-        assert toc_element.content['items'] == ['Introduction', 'Methods', 'Results', 'Conclusion']
-
-    def test_metadata_extraction(self, parser):
-        """Test that metadata is properly extracted."""
-        latex_content = r"""
+_TEX_METADATA = r"""
 \documentclass{beamer}
 \title{Advanced Machine Learning}
 \subtitle{Deep Learning Techniques}
@@ -122,20 +72,7 @@ Some content here
 \end{document}
 """
 
-        document = parser.parse_string(latex_content)
-
-        # Check extracted metadata
-        assert document.metadata.title == "Advanced Machine Learning"
-        assert document.metadata.author == "Dr. Jane Smith"
-        assert document.metadata.date == "January 2024"
-
-        # Check document class extraction
-        assert 'documentclass' in document.metadata.custom_properties
-        assert document.metadata.custom_properties['documentclass'] == 'beamer'
-
-    def test_complex_document_structure(self, parser):
-        """Test parsing of a complete document with all structural elements."""
-        latex_content = r"""
+_TEX_COMPLEX = r"""
 \documentclass[aspectratio=169]{beamer}
 \title{Complex Presentation}
 \author{Research Team}
@@ -180,7 +117,112 @@ Results content here
 \end{document}
 """
 
-        document = parser.parse_string(latex_content)
+_TEX_NO_SECTIONS = r"""
+\documentclass{beamer}
+\title{Simple Presentation}
+\author{Simple Author}
+
+\begin{document}
+\begin{frame}
+\titlepage
+\end{frame}
+
+\begin{frame}{Content}
+No sections here
+\end{frame}
+\end{document}
+"""
+
+_TEX_MULTI_TOC = r"""
+\documentclass{beamer}
+\title{Multi TOC Test}
+
+\begin{document}
+\section{Part 1}
+\section{Part 2}
+
+\begin{frame}{First Outline}
+\tableofcontents
+\end{frame}
+
+\begin{frame}{Second Outline}
+\tableofcontents
+\end{frame}
+\end{document}
+"""
+
+_TEX_SPECIAL_SECTIONS = r"""
+\documentclass{beamer}
+\title{Special Characters}
+
+\begin{document}
+\section{Math \& Logic}
+\section{Data \& Analysis}
+\section{AI/ML: Future \& Present}
+
+\begin{frame}{Outline}
+\tableofcontents
+\end{frame}
+\end{document}
+"""
+
+
+class TestLaTeXParserStructure:
+    """Test cases for LaTeX parser structural features."""
+
+    def test_title_slide_detection(self, parser):
+        """Test that title slides are properly detected from \\titlepage."""
+        document = parser.parse_string(_TEX_TITLE_SLIDE)
+
+        # Should have 2 frames
+        assert len(document.frames) == 2
+
+        # First frame should be title slide
+        title_frame = document.frames[0]
+        assert title_frame.layout == Layout_Type.TITLE_SLIDE
+        assert title_frame.title == "Test Presentation"
+
+        # Second frame should be regular slide
+        content_frame = document.frames[1]
+        assert content_frame.layout == Layout_Type.TITLE_AND_CONTENT
+        assert content_frame.title == "Regular Slide"
+
+    def test_table_of_contents_generation(self, parser):
+        """Test that table of contents is properly generated."""
+        document = parser.parse_string(_TEX_TOC)
+
+        # Should collect sections
+        assert len(parser.sections) == 4
+        assert "Introduction" in parser.sections
+        assert "Methods" in parser.sections
+        assert "Results" in parser.sections
+        assert "Conclusion" in parser.sections
+
+        # Should have outline frame with table of contents
+        outline_frame = document.frames[0]
+        assert outline_frame.title == "Outline"
+        assert len(outline_frame.elements) == 1
+
+        toc_element = outline_frame.elements[0]
+        assert toc_element.element_type == Element_Type.ITEMIZE
+        assert toc_element.content['items'] == ['Introduction', 'Methods', 'Results', 'Conclusion']
+
+    def test_metadata_extraction(self, parser):
+        """Test that metadata is properly extracted."""
+        document = parser.parse_string(_TEX_METADATA)
+
+        # Check extracted metadata
+        assert document.metadata.title == "Advanced Machine Learning"
+        assert document.metadata.author == "Dr. Jane Smith"
+        assert document.metadata.date == "January 2024"
+
+        # Check document class extraction
+        assert 'documentclass' in document.metadata.custom_properties
+        assert document.metadata.custom_properties['documentclass'] == 'beamer'
+
+    def test_complex_document_structure(self, parser):
+        """Test parsing of a complete document with all structural elements."""
+        document = parser.parse_string(_TEX_COMPLEX)
 
         # Should have 5 frames total
         assert len(document.frames) == 5
@@ -203,35 +245,14 @@ Results content here
         assert parser.sections == ["Background", "Methodology", "Results"]
 
         # Check content slides
-        background_frame = document.frames[2]
-        assert background_frame.title == "Background"
-        assert len(background_frame.elements) == 1  # itemize content
-
-        methodology_frame = document.frames[3]
-        assert methodology_frame.title == "Methodology"
-
-        results_frame = document.frames[4]
-        assert results_frame.title == "Results"
+        assert tuple(frame.title for frame in document.frames) == (
+            "Complex Presentation", "Agenda", "Background", "Methodology",
+            "Results")
+        assert len(document.frames[2].elements) == 1  # itemize content
 
     def test_empty_sections_handling(self, parser):
         """Test handling of documents with no sections."""
-        latex_content = r"""
-\documentclass{beamer}
-\title{Simple Presentation}
-\author{Simple Author}
-
-\begin{document}
-\begin{frame}
-\titlepage
-\end{frame}
-
-\begin{frame}{Content}
-No sections here
-\end{frame}
-\end{document}
-"""
-
-        document = parser.parse_string(latex_content)
+        document = parser.parse_string(_TEX_NO_SECTIONS)
 
         # Should have no sections collected
         assert len(parser.sections) == 0
@@ -242,25 +263,7 @@ No sections here
 
     def test_multiple_table_of_contents(self, parser):
         """Test handling of multiple table of contents commands."""
-        latex_content = r"""
-\documentclass{beamer}
-\title{Multi TOC Test}
-
-\begin{document}
-\section{Part 1}
-\section{Part 2}
-
-\begin{frame}{First Outline}
-\tableofcontents
-\end{frame}
-
-\begin{frame}{Second Outline}
-\tableofcontents
-\end{frame}
-\end{document}
-"""
-
-        document = parser.parse_string(latex_content)
+        document = parser.parse_string(_TEX_MULTI_TOC)
 
         # Should have 2 outline frames
         assert len(document.frames) == 2
@@ -273,22 +276,7 @@ No sections here
 
     def test_section_with_special_characters(self, parser):
         """Test handling of sections with special characters."""
-        latex_content = r"""
-\documentclass{beamer}
-\title{Special Characters}
-
-\begin{document}
-\section{Math \& Logic}
-\section{Data \& Analysis}
-\section{AI/ML: Future \& Present}
-
-\begin{frame}{Outline}
-\tableofcontents
-\end{frame}
-\end{document}
-"""
-
-        document = parser.parse_string(latex_content)
+        document = parser.parse_string(_TEX_SPECIAL_SECTIONS)
 
         # Should handle special characters correctly
         assert len(parser.sections) == 3
@@ -302,3 +290,17 @@ No sections here
         assert "Math & Logic" in toc_element.content['items']
         assert "Data & Analysis" in toc_element.content['items']
         assert "AI/ML: Future & Present" in toc_element.content['items']
+
+    def test_reset_clears_document_state(self, parser):
+        """Test that reset clears sections collected by a previous parse."""
+        parser.parse_string(r"""
+\section{Leftover}
+\begin{frame}{Outline}
+\tableofcontents
+\end{frame}
+""")
+        assert parser.sections == ["Leftover"]
+
+        parser.reset()
+
+        assert parser.sections == []
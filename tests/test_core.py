@@ -24,41 +24,14 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 from slideforge.core import Slide_Forge
+from slideforge.mappers.content_mapper import Content_Mapper
 from slideforge.models.universal import (
     Universal_Document, Universal_Frame, Universal_Element,
     Element_Type, Layout_Type
 )
 
 
-class TestSlideForge:
-    """Test cases for Slide Forge core controller."""
-
-    @pytest.fixture
-    def slide_forge(self):
-        """Create Slide_Forge instance."""
-
-        # Create instance without auto-registration for testing
-        slide_forge = Slide_Forge()
-
-        # Clear auto-registered components for clean test
-        # But keep them for format-related tests
-        original_parsers = slide_forge.parsers.copy()
-        original_builders = slide_forge.builders.copy()
-
-        slide_forge.parsers = {}
-        slide_forge.builders = {}
-
-        # Store originals for format tests
-        slide_forge._original_parsers = original_parsers
-        slide_forge._original_builders = original_builders
-
-        # Keep mapper as it's expected to be initialized
-        return slide_forge
-
-    @pytest.fixture
-    def sample_latex_file(self, tmp_path):
-        """Create sample LaTeX file."""
-        latex_content = r"""
+_TEX_SAMPLE = r"""
 \documentclass{beamer}
 \title{Test Presentation}
 \author{Test Author}
@@ -77,14 +50,78 @@ class TestSlideForge:
 \end{document}
 """
 
-        tex_file = tmp_path / "test.tex"
-        tex_file.write_text(latex_content)
-        return tex_file
+_TEX_SIMPLE_FRAME = r"""
+\begin{frame}{Test Frame}
+    Test content
+\end{frame}
+"""
+
+_TEX_INVALID = r"""
+\begin{frame}{Invalid Frame
+    Missing closing brace
+\end{document}
+"""
+
+
+@pytest.fixture(scope="module")
+def sample_latex_file(tmp_path_factory):
+    """Create sample LaTeX file once per module; tests only read it."""
+    tex_file = tmp_path_factory.mktemp("tex") / "test.tex"
+    tex_file.write_text(_TEX_SAMPLE)
+    return tex_file
+
+
+@pytest.fixture(scope="module")
+def shared_output(tmp_path_factory):
+    """Create one output file path per module; conversions overwrite it."""
+    return tmp_path_factory.mktemp("out") / "shared.pptx"
+
+
+class TestSlideForge:
+    """Test cases for Slide Forge core controller."""
+
+    @pytest.fixture
+    def slide_forge(self):
+        """Create Slide_Forge instance."""
+
+        # Create instance without auto-registration for testing
+        slide_forge = Slide_Forge(auto_register=False)
+
+        # Keep mapper as it's expected to be initialized
+        slide_forge.register_mapper(Content_Mapper())
+        return slide_forge
+
+    @pytest.fixture
+    def registered_slide_forge(self):
+        """Create Slide_Forge with all available components registered."""
+        return Slide_Forge()
 
     @pytest.fixture
-    def output_file(self, tmp_path):
-        """Create temporary output file path."""
-        return tmp_path / "test_output.pptx"
+    def output_file(self, shared_output):
+        """Return the shared output path, removing any earlier output file."""
+        shared_output.unlink(missing_ok=True)
+        return shared_output
+
+    @pytest.fixture
+    def mocked_slide_forge(self, slide_forge, sample_latex_file):
+        """Slide_Forge with a mock latex parser, pptx builder and mapper."""
+        mock_document = Mock()
+        mock_document.get_total_frames.return_value = 1
+        mock_document.source_format = 'latex'
+        mock_document.source_path = sample_latex_file
+
+        mock_parser = Mock()
+        mock_parser.parse_file.return_value = mock_document
+        slide_forge.parsers['latex'] = mock_parser
+        slide_forge.builders['pptx'] = Mock()
+
+        # Configure mapper to avoid iteration issues
+        mock_mapper = Mock()
+        mock_mapper.can_convert.return_value = True
+        mock_mapper.map_document.return_value = []
+        slide_forge.mapper = mock_mapper
+
+        return slide_forge
 
     def test_initialization(self, slide_forge):
         """Test Slide_Forge initialization."""
@@ -107,6 +144,17 @@ class TestSlideForge:
         assert 'latex' in slide_forge.parsers
         assert 'pptx' in slide_forge.builders
 
+    def test_component_discovery_is_cached(self):
+        """Test that component classes are discovered once per process."""
+        first = Slide_Forge()
+        second = Slide_Forge()
+
+        discovered = Slide_Forge._discover_components()
+        assert Slide_Forge._discover_components() is discovered
+        assert type(first.parsers['latex']) is type(second.parsers['latex'])
+        assert first.parsers['latex'] is not second.parsers['latex']
+        assert first.builders['pptx'] is not second.builders['pptx']
+
     def test_register_parser(self, slide_forge):
         """Test parser registration."""
         mock_parser = Mock()
@@ -133,11 +181,9 @@ class TestSlideForge:
 
         assert slide_forge.mapper == mock_mapper
 
-    def test_get_supported_formats(self, slide_forge):
+    def test_get_supported_formats(self, registered_slide_forge):
         """Test getting supported formats."""
-        # Restore parsers and builders for this test
-        slide_forge.parsers = slide_forge._original_parsers
-        slide_forge.builders = slide_forge._original_builders
+        slide_forge = registered_slide_forge
 
         formats = slide_forge.get_supported_formats()
 
@@ -146,11 +192,9 @@ class TestSlideForge:
         assert 'latex' in formats['input']
         assert 'pptx' in formats['output']
 
-    def test_get_supported_conversions(self, slide_forge):
+    def test_get_supported_conversions(self, registered_slide_forge):
         """Test getting supported conversions."""
-        # Restore parsers and builders for this test
-        slide_forge.parsers = slide_forge._original_parsers
-        slide_forge.builders = slide_forge._original_builders
+        slide_forge = registered_slide_forge
 
         conversions = slide_forge.get_supported_conversions()
 
@@ -158,35 +202,31 @@ class TestSlideForge:
         # Should have latex to pptx conversion
         assert any(source == 'latex' and 'pptx' in targets for source, targets in conversions)
 
-    def test_convert_file_success(self, slide_forge, sample_latex_file, output_file):
-        """Test successful file conversion."""
-        # Restore parsers and builders for conversion tests
-        slide_forge.parsers = slide_forge._original_parsers
-        slide_forge.builders = slide_forge._original_builders
+    @pytest.mark.parametrize("options", [
+        {"verbose": False},
+        {"theme": "professional", "preserve_colors": False, "verbose": True},
+        {"theme": "academic", "preserve_colors": True, "verbose": True},
+    ], ids=["defaults", "professional", "academic"])
+    def test_convert_file_variants(self, registered_slide_forge,
+                                   sample_latex_file, output_file, options):
+        """Test file conversion, detecting the source format from the file."""
+        slide_forge = registered_slide_forge
 
         success = slide_forge.convert_file(
             str(sample_latex_file),
             str(output_file),
-            verbose=False
+            **options
         )
 
         assert success
         assert output_file.exists()
 
-    def test_convert_string_success(self, slide_forge, output_file):
+    def test_convert_string_success(self, registered_slide_forge, output_file):
         """Test successful string conversion."""
-        # Restore parsers and builders for conversion tests
-        slide_forge.parsers = slide_forge._original_parsers
-        slide_forge.builders = slide_forge._original_builders
-
-        latex_content = r"""
-\begin{frame}{Test Frame}
-    Test content
-\end{frame}
-"""
+        slide_forge = registered_slide_forge
 
         success = slide_forge.convert_string(
-            latex_content,
+            _TEX_SIMPLE_FRAME,
             str(output_file),
             'latex',
             verbose=False
@@ -195,35 +235,26 @@ class TestSlideForge:
         assert success
         assert output_file.exists()
 
-    def test_convert_file_missing_parser(self, slide_forge, output_file):
+    def test_convert_file_missing_parser(self, slide_forge, output_file,
+                                         tmp_path):
         """Test conversion with missing parser."""
         # Create a file with unsupported extension
-        unsupported_file = Path("test.unsupported")
+        unsupported_file = tmp_path / "test.unsupported"
         unsupported_file.write_text("content")
 
-        try:
+        with pytest.raises(Exception):
             slide_forge.convert_file(str(unsupported_file), str(output_file))
-            assert False, "Should have failed with missing parser"
-        except Exception:
-            pass  # Expected to fail
-        finally:
-            unsupported_file.unlink(missing_ok=True)
 
     def test_convert_file_missing_builder(self, slide_forge, sample_latex_file, tmp_path):
         """Test conversion with missing builder."""
         unsupported_output = tmp_path / "test.unsupported"
 
-        try:
+        with pytest.raises(Exception):
             slide_forge.convert_file(
                 str(sample_latex_file),
                 str(unsupported_output),
                 target_format='unsupported'
             )
-            assert False, "Should have failed with missing builder"
-        except Exception:
-            pass  # Expected to fail
-        finally:
-            unsupported_output.unlink(missing_ok=True)
 
     def test_set_default_options(self, slide_forge):
         """Test setting default options."""
@@ -242,56 +273,13 @@ class TestSlideForge:
         # Should not raise error, just log warning
         slide_forge.set_default_options(invalid_option="test")
 
-    def test_convert_file_no_source_format(self, slide_forge, sample_latex_file, output_file):
-        """Test conversion without specifying source format."""
-        # Restore parsers and builders for conversion tests
-        slide_forge.parsers = slide_forge._original_parsers
-        slide_forge.builders = slide_forge._original_builders
-
-        success = slide_forge.convert_file(
-            str(sample_latex_file),
-            str(output_file),
-            verbose=False
-        )
-
-        assert success
-        assert output_file.exists()
-
-    def test_convert_string_no_target_format(self, slide_forge, output_file):
-        """Test string conversion without specifying target format."""
-        # Restore parsers and builders for conversion tests
-        slide_forge.parsers = slide_forge._original_parsers
-        slide_forge.builders = slide_forge._original_builders
-
-        latex_content = r"""
-\begin{frame}{Test Frame}
-    Test content
-\end{frame}
-"""
-
-        success = slide_forge.convert_string(
-            latex_content,
-            str(output_file),
-            'latex',
-            verbose=False
-        )
-
-        assert success
-        assert output_file.exists()
-
-    @patch('slideforge.core.Slide_Forge._initialize_components')
-    def test_no_components_available(self, mock_init, slide_forge, sample_latex_file, output_file):
+    def test_no_components_available(self, sample_latex_file, output_file):
         """Test conversion when no components are available."""
-        # Mock initialization to have no components
-        slide_forge.parsers = {}
-        slide_forge.builders = {}
+        slide_forge = Slide_Forge(auto_register=False)
         slide_forge.mapper = None
 
-        try:
+        with pytest.raises(Exception):
             slide_forge.convert_file(str(sample_latex_file), str(output_file))
-            assert False, "Should have failed with no components"
-        except Exception:
-            pass  # Expected to fail
 
     def test_document_to_slides_no_mapper(self, slide_forge):
         """Test _document_to_slides when no mapper is available."""
@@ -304,28 +292,18 @@ class TestSlideForge:
 
         assert slides == []  # Should return empty list
 
-    def test_error_handling(self, slide_forge):
+    def test_error_handling(self, slide_forge, output_file):
         """Test error handling in conversion."""
         # Test with invalid LaTeX content
-        invalid_latex = r"""
-\begin{frame}{Invalid Frame
-    Missing closing brace
-\end{document}
-"""
-
-        try:
-            slide_forge.convert_string(invalid_latex, "test.pptx", "latex")
-            assert False, "Should have failed with invalid LaTeX"
-        except Exception:
-            pass  # Expected to fail
+        with pytest.raises(Exception):
+            slide_forge.convert_string(_TEX_INVALID, str(output_file), "latex")
 
-    def test_verbose_logging(self, slide_forge, sample_latex_file, output_file, caplog):
+    def test_verbose_logging(self, registered_slide_forge, sample_latex_file,
+                             output_file, caplog):
         """Test verbose logging during conversion."""
         import logging
 
-        # Restore parsers and builders for conversion tests
-        slide_forge.parsers = slide_forge._original_parsers
-        slide_forge.builders = slide_forge._original_builders
+        slide_forge = registered_slide_forge
 
         with caplog.at_level(logging.INFO):
             success = slide_forge.convert_file(
@@ -335,62 +313,23 @@ class TestSlideForge:
             )
 
             # Should have logged conversion start and success messages
-            assert any("Starting conversion" in record.message for record in caplog.records)
-            assert any("Successfully built" in record.message for record in caplog.records)
-
-    def test_custom_settings_passed_through(self, slide_forge, sample_latex_file, output_file):
-        """Test that custom settings are passed through correctly."""
-        # Register mock components for testing
-        from unittest.mock import Mock
-        mock_parser = Mock()
-        mock_document = Mock()
-        mock_document.get_total_frames.return_value = 1
-        mock_document.source_format = 'latex'
-        mock_document.source_path = sample_latex_file
-        mock_parser.parse_file.return_value = mock_document
-
-        slide_forge.parsers['latex'] = mock_parser
-        slide_forge.builders['pptx'] = Mock()
+            messages = "\n".join(record.message for record in caplog.records)
+            assert "Starting conversion" in messages
+            assert "Successfully built" in messages
 
-        # Configure mapper to avoid iteration issues
-        slide_forge.mapper = Mock()
-        slide_forge.mapper.can_convert.return_value = True
-        slide_forge.mapper.map_document.return_value = []
+    def test_custom_settings_passed_through(self, slide_forge):
+        """Test that custom settings are merged with the source path."""
+        source_path = Path("/p/talk.tex")
+        build_options = slide_forge._make_build_options(
+            {"custom_option": "custom_value"}, source_path)
 
-        custom_settings = {"custom_option": "custom_value"}
+        assert build_options == {"custom_option": "custom_value",
+                                 "source_path": str(source_path)}
 
-        with patch.object(slide_forge.builders['pptx'], 'build_presentation') as mock_build:
-            slide_forge.convert_file(
-                str(sample_latex_file),
-                str(output_file),
-                custom_settings=custom_settings
-            )
-
-            # Check that custom settings were passed (merged with source_path)
-            mock_build.assert_called_once()
-            call_args = mock_build.call_args
-            build_options = call_args[1]
-            assert 'custom_option' in build_options
-            assert build_options['custom_option'] == 'custom_value'
-            assert 'source_path' in build_options
-
-    def test_source_path_passed_to_builder(self, slide_forge, sample_latex_file, output_file):
+    def test_source_path_passed_to_builder(self, mocked_slide_forge,
+                                           sample_latex_file, output_file):
         """Test that source path is passed to builder."""
-        # Register mock components for testing
-        from unittest.mock import Mock
-        mock_parser = Mock()
-        mock_document = Mock()
-        mock_document.get_total_frames.return_value = 1
-        mock_document.source_format = 'latex'
-        mock_document.source_path = sample_latex_file
-        mock_parser.parse_file.return_value = mock_document
-
-        slide_forge.parsers['latex'] = mock_parser
-        slide_forge.builders['pptx'] = Mock()
-        # Configure mapper to avoid iteration issues
-        slide_forge.mapper = Mock()
-        slide_forge.mapper.can_convert.return_value = True
-        slide_forge.mapper.map_document.return_value = []
+        slide_forge = mocked_slide_forge
 
         with patch.object(slide_forge.builders['pptx'], 'build_presentation') as mock_build:
             slide_forge.convert_file(
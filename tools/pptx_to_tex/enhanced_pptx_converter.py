@@ -24,23 +24,71 @@
 Enhanced LaTeX to PowerPoint converter using structured parsing
 """
 
+from __future__ import annotations
+
 from advanced_latex_parser import LaTeXBeamerParser
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
-from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
+from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
+import io
+import os
+from pathlib import Path
 import logging
 
+# python-pptx is imported where slides are built, so the parsing and path
+# helpers load without it
+if TYPE_CHECKING:
+    from pptx import Presentation
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# EMUs (python-pptx's length unit) per inch
+_EMU_PER_INCH = 914400
+
+# Common image directories to check, relative to the LaTeX directory
+_TEX_DIR = Path("latex")
+_IMAGE_DIRS = tuple(_TEX_DIR / img_dir
+                    for img_dir in ["", "images", "..", "../images"])
+
+
+@lru_cache(maxsize=512)
+def _resolve_image_path(base_dir: str, path: str) -> Optional[str]:
+    """Resolve image path to an absolute path under base_dir's LaTeX dir"""
+    for img_dir in _IMAGE_DIRS:
+        full_path = Path(base_dir) / img_dir / path
+        if full_path.exists():
+            return str(full_path)
+
+    return None
+
+
+# Element types that need the title-and-content layout
+_COMPLEX_ELEMENT_TYPES = frozenset({'itemize', 'block', 'columns', 'image'})
+
 class EnhancedPPTXConverter:
     """Convert structured LaTeX data to high-quality PowerPoint"""
 
+    # Font sizes (points) and image geometry (EMUs) shared by every slide
+    _FONT_DEFAULT = 18
+    _FONT_BLOCK = 16
+    _IMG_LEFT = 1 * _EMU_PER_INCH
+    _IMG_TOP = 2 * _EMU_PER_INCH
+    _IMG_WIDTH = 8 * _EMU_PER_INCH
+
     def __init__(self):
         self.parser = LaTeXBeamerParser()
 
+        # Image file contents by resolved path, read once per conversion
+        self._image_cache = {}
+
+        # Placeholder content handlers, keyed by parsed element type
+        self._element_handlers = {
+            'text': self._add_text_element,
+            'itemize': self._add_itemize_element,
+            'block': self._add_block_element,
+            'center': self._add_center_element,
+        }
+
     def convert_latex_to_pptx(self, latex_file: str, output_file: str):
         """Convert LaTeX file to PowerPoint with enhanced formatting"""
 
@@ -49,14 +97,20 @@ class EnhancedPPTXConverter:
         latex_data = self.parser.parse_file(latex_file)
 
         # Create PowerPoint presentation
+        from pptx import Presentation
+
         prs = Presentation()
 
         # Add title slide
         self._create_title_slide(prs, latex_data['metadata'])
 
+        # Look up the frame layouts once for all frames
+        layout_complex = prs.slide_layouts[1]  # Title and content
+        layout_simple = prs.slide_layouts[2]  # Section header
+
         # Convert each frame
         for frame in latex_data['frames']:
-            self._convert_frame(prs, frame)
+            self._convert_frame(prs, frame, layout_complex, layout_simple)
 
         # Save presentation
         prs.save(output_file)
@@ -77,14 +131,15 @@ class EnhancedPPTXConverter:
         if subtitle and len(title_slide.placeholders) > 1:
             title_slide.placeholders[1].text = subtitle
 
-    def _convert_frame(self, prs: Presentation, frame: dict):
+    def _convert_frame(self, prs: Presentation, frame: dict, layout_complex,
+                       layout_simple):
         """Convert a single frame to PowerPoint slide"""
 
         # Choose appropriate layout
         if self._has_complex_content(frame):
-            slide_layout = prs.slide_layouts[1]  # Title and content
+            slide_layout = layout_complex
         else:
-            slide_layout = prs.slide_layouts[2]  # Section header
+            slide_layout = layout_simple
 
         slide = prs.slides.add_slide(slide_layout)
 
@@ -102,81 +157,95 @@ class EnhancedPPTXConverter:
 
     def _has_complex_content(self, frame: dict) -> bool:
         """Check if frame has complex content needing full layout"""
-        for element in frame['elements']:
-            if element['type'] in ['itemize', 'block', 'columns', 'image']:
-                return True
-        return False
+        return any(element['type'] in _COMPLEX_ELEMENT_TYPES
+                   for element in frame['elements'])
 
     def _add_content_to_placeholder(self, placeholder, elements: list):
         """Add content to slide placeholder with proper formatting"""
         text_frame = placeholder.text_frame
         text_frame.clear()  # Remove existing text
 
-        # Debug: print element structure
-        print(f"Processing {len(elements)} elements:")
-        for i, element in enumerate(elements):
-            print(f"  {i}: {element['type']} - {element}")
+        # Debug: log element structure
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing %d elements:", len(elements))
+            for i, element in enumerate(elements):
+                logger.debug("  %d: %s - %s", i, element['type'], element)
 
+        handlers = self._element_handlers
         for element in elements:
-            if element['type'] == 'text':
-                p = text_frame.add_paragraph()
-                p.text = element['text']
-                p.font.size = Pt(18)
-
-                # Apply formatting if specified
-                if element.get('formatting') == 'bold':
-                    p.font.bold = True
-                elif element.get('formatting') == 'italic':
-                    p.font.italic = True
-
-            elif element['type'] == 'itemize':
-                # Handle itemize environment
-                for item in element.get('content', []):
-                    if item['type'] == 'item':
-                        p = text_frame.add_paragraph()
-                        p.text = item['text']
-                        p.level = 0  # Bullet level
-                        p.font.size = Pt(18)
-
-                        # Enable bullet
-                        if hasattr(p, 'bullet'):
-                            p.bullet = True
-
-            elif element['type'] == 'block':
-                # Handle block environments
-                block_content = element.get('content', [])
-                if isinstance(block_content, list):
-                    # Extract text from content list
-                    content_parts = []
-                    for item in block_content:
-                        if isinstance(item, dict) and 'text' in item:
-                            content_parts.append(item['text'])
-                        elif isinstance(item, str):
-                            content_parts.append(item)
-                    content_text = ' '.join(content_parts)
-                else:
-                    content_text = str(block_content)
-
+            handler = handlers.get(element['type'])
+            if handler:
+                handler(placeholder, text_frame, element)
+
+    def _add_text_element(self, placeholder, text_frame, element: dict):
+        """Add a text element as a paragraph"""
+        from pptx.util import Pt
+
+        p = text_frame.add_paragraph()
+        p.text = element['text']
+        p.font.size = Pt(self._FONT_DEFAULT)
+
+        # Apply formatting if specified
+        if element.get('formatting') == 'bold':
+            p.font.bold = True
+        elif element.get('formatting') == 'italic':
+            p.font.italic = True
+
+    def _add_itemize_element(self, placeholder, text_frame, element: dict):
+        """Add an itemize environment as bulleted paragraphs"""
+        from pptx.util import Pt
+
+        for item in element.get('content', []):
+            if item['type'] == 'item':
                 p = text_frame.add_paragraph()
-                p.text = content_text
-                p.font.size = Pt(16)
-                p.font.bold = True
-
-                # Add background shape for block
-                self._add_block_background(placeholder)
-
-            elif element['type'] == 'center':
-                # Handle centered content
-                content_list = element.get('content', [])
-                for item in content_list:
-                    if isinstance(item, dict) and 'text' in item:
-                        text = item['text']
-                        # Skip image commands for now
-                        if not text.startswith('[width='):
-                            p = text_frame.add_paragraph()
-                            p.text = text
-                            p.alignment = PP_ALIGN.CENTER
-                            p.font.size = Pt(18)
+                p.text = item['text']
+                p.level = 0  # Bullet level
+                p.font.size = Pt(self._FONT_DEFAULT)
+
+                # Enable bullet
+                if hasattr(p, 'bullet'):
+                    p.bullet = True
+
+    def _add_block_element(self, placeholder, text_frame, element: dict):
+        """Add a block environment as one bold paragraph"""
+        from pptx.util import Pt
+
+        block_content = element.get('content', [])
+        if isinstance(block_content, list):
+            # Extract text from content list
+            content_parts = []
+            for item in block_content:
+                if isinstance(item, dict) and 'text' in item:
+                    content_parts.append(item['text'])
+                elif isinstance(item, str):
+                    content_parts.append(item)
+            content_text = ' '.join(content_parts)
+        else:
+            content_text = str(block_content)
+
+        p = text_frame.add_paragraph()
+        p.text = content_text
+        p.font.size = Pt(self._FONT_BLOCK)
+        p.font.bold = True
+
+        # Add background shape for block
+        self._add_block_background(placeholder)
+
+    def _add_center_element(self, placeholder, text_frame, element: dict):
+        """Add centered content as centered paragraphs"""
+        from pptx.enum.text import PP_ALIGN
+        from pptx.util import Pt
+
+        content_list = element.get('content', [])
+        for item in content_list:
+            if isinstance(item, dict) and 'text' in item:
+                text = item['text']
+                # Skip image commands for now
+                if not text.startswith('[width='):
+                    p = text_frame.add_paragraph()
+                    p.text = text
+                    p.alignment = PP_ALIGN.CENTER
+                    p.font.size = Pt(self._FONT_DEFAULT)
 
     def _add_images_to_slide(self, slide, elements: list):
         """Add images to slide with proper positioning"""
@@ -186,12 +255,17 @@ class EnhancedPPTXConverter:
                     # Try to resolve image path
                     img_path = self._resolve_image_path(element['path'])
                     if img_path:
+                        data = self._image_cache.get(img_path)
+                        if data is None:
+                            data = Path(img_path).read_bytes()
+                            self._image_cache[img_path] = data
+
                         # Add image centered on slide
                         slide.shapes.add_picture(
-                            img_path,
-                            left=Inches(1),
-                            top=Inches(2),
-                            width=Inches(8)
+                            io.BytesIO(data),
+                            left=self._IMG_LEFT,
+                            top=self._IMG_TOP,
+                            width=self._IMG_WIDTH
                         )
                 except Exception as e:
                     logger.warning(f"Could not add image {element['path']}: {e}")
@@ -202,21 +276,10 @@ class EnhancedPPTXConverter:
         # For now, we'll just rely on text formatting
         pass
 
-    def _resolve_image_path(self, path: str) -> str:
+    def _resolve_image_path(self, path: str) -> Optional[str]:
         """Resolve image path relative to LaTeX file"""
-        import os
-        from pathlib import Path
-
-        # Common image directories to check
-        tex_dir = Path("latex")
-        image_dirs = ["", "images", "..", "../images"]
-
-        for img_dir in image_dirs:
-            full_path = tex_dir / img_dir / path
-            if full_path.exists():
-                return str(full_path)
-
-        return None
+        # Key the cache on the working directory the relative paths start from
+        return _resolve_image_path(os.getcwd(), path)
 
 def main():
     converter = EnhancedPPTXConverter()
@@ -25,158 +25,173 @@ LaTeX Beamer to PowerPoint Converter
 Extracts individual frames and converts them to separate slides
 """
 
+import mmap
 import re
-import subprocess
-import tempfile
 import os
-from pathlib import Path
+
+# Frame and metadata patterns over the raw file bytes (handle optional
+# arguments like \begin{frame}[plain,t])
+_FRAME_RE = re.compile(
+    rb'\\begin\{frame\}(?:\[[^\]]*\])?\s*(.*?)\\end\{frame\}', re.DOTALL)
+_TITLE_RE = re.compile(rb'\\title\{(.*?)\}')
+_AUTHOR_RE = re.compile(rb'\\author\{(.*?)\}')
+_FRAMETITLE_CAPTURE_RE = re.compile(r'\\frametitle\{(.*?)\}')
+
+# Content cleaning patterns, applied in order by clean_latex_content
+_FRAMETITLE_RE = re.compile(r'\\frametitle\{[^}]*\}')
+_ITEMIZE_BEGIN_RE = re.compile(r'\\begin\{itemize\}')
+_ITEMIZE_END_RE = re.compile(r'\\end\{itemize\}')
+_ITEM_RE = re.compile(r'\\item\s*')
+_TEXTBF_RE = re.compile(r'\\textbf\{([^}]+)\}')
+_LINEBREAK_RE = re.compile(r'\\\\')
+_CMD_ARG_RE = re.compile(r'\\[a-zA-Z]+\{([^}]*)\}')
+_CMD_RE = re.compile(r'\\[a-zA-Z]+')
+_BRACE_RE = re.compile(r'[{}]')
+
+# Text lines that are not already HTML, without their surrounding whitespace
+_PARA_RE = re.compile(r'^[^\S\n]*([^<\s].*?)[^\S\n]*$', re.MULTILINE)
+
+# Commands (with any [options]) left in slide text once line breaks are
+# spaces; their braced arguments stay as plain text
+_SLIDE_COMMAND_RE = re.compile(r'\\[a-zA-Z]+\*?(?:\[[^\]]*\])?')
+# Lines that only lay out the slide and carry no text of their own
+_LAYOUT_LINE_RE = re.compile(
+    r'\\(?:column|includegraphics|vspace|hspace|centering|pause)\b')
+# Title given as \begin{frame}{title}, at the start of the extracted frame
+_FRAME_ARG_TITLE_RE = re.compile(r'\{([^}]*)\}')
+
+
+def _decode(raw):
+    """Decode matched file bytes, normalizing newlines like text-mode reads"""
+    return raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
 
 def extract_frames_from_tex(tex_file):
     """Extract individual frames from LaTeX Beamer file"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Memory-map the file so all searches share one buffer (mmap rejects
+    # empty files)
+    with open(tex_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return _extract_frames(content)
+    return _extract_frames(b'')
+
 
-    # Extract frames (handle optional arguments like \begin{frame}[plain,t])
-    frame_pattern = r'\\begin\{frame\}(?:\[[^\]]*\])?\s*(.*?)\\end\{frame\}'
-    frames = re.findall(frame_pattern, content, re.DOTALL)
+def _extract_frames(content):
+    """Extract frames and title metadata from LaTeX source bytes"""
+    # Extract frames, decoding only the matched text
+    frames = [_decode(frame) for frame in _FRAME_RE.findall(content)]
 
     # Extract metadata for title slide
-    title_match = re.search(r'\\title\{(.*?)\}', content)
-    author_match = re.search(r'\\author\{(.*?)\}', content)
+    title_match = _TITLE_RE.search(content)
+    author_match = _AUTHOR_RE.search(content)
 
     metadata = {
-        'title': title_match.group(1) if title_match else 'Presentation',
-        'author': author_match.group(1) if author_match else ''
+        'title': (_decode(title_match.group(1)) if title_match
+                  else 'Presentation'),
+        'author': _decode(author_match.group(1)) if author_match else ''
     }
 
     return frames, metadata
 
-def create_temp_html_files(frames, metadata):
-    """Create temporary HTML files for each frame"""
-    temp_files = []
-
-    # Create title slide
-    title_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{metadata['title']}</title>
-</head>
-<body>
-    <h1>{metadata['title']}</h1>
-    <h2>{metadata['author']}</h2>
-</body>
-</html>"""
-
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-        f.write(title_html)
-        temp_files.append(f.name)
-
-    # Create content slides
-    for i, frame in enumerate(frames):
-        # Extract frame title
-        title_match = re.search(r'\\frametitle\{(.*?)\}', frame)
-        frame_title = title_match.group(1) if title_match else f"Slide {i+1}"
-
-        # Clean frame content
-        clean_content = clean_latex_content(frame)
-
-        frame_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{frame_title}</title>
-</head>
-<body>
-    <h1>{frame_title}</h1>
-    {clean_content}
-</body>
-</html>"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-            f.write(frame_html)
-            temp_files.append(f.name)
-
-    return temp_files
-
 def clean_latex_content(content):
     """Clean LaTeX commands from content"""
-    # Remove frame title
-    content = re.sub(r'\\frametitle\{[^}]*\}', '', content)
-
-    # Convert itemize to HTML lists
-    content = re.sub(r'\\begin\{itemize\}', '<ul>', content)
-    content = re.sub(r'\\end\{itemize\}', '</ul>', content)
-    content = re.sub(r'\\item\s*', '<li>', content)
-
-    # Convert textbf to bold
-    content = re.sub(r'\\textbf\{([^}]+)\}', r'<strong>\1</strong>', content)
-
-    # Handle line breaks
-    content = re.sub(r'\\\\', '<br>', content)
-
-    # Remove other LaTeX commands
-    content = re.sub(r'\\[a-zA-Z]+\{([^}]*)\}', r'\1', content)
-    content = re.sub(r'\\[a-zA-Z]+', '', content)
-    content = re.sub(r'[{}]', '', content)
-
-    # Convert newlines to <p>
-    paragraphs = content.split('\n')
-    html_paragraphs = []
-    for para in paragraphs:
-        para = para.strip()
-        if para and not para.startswith('<'):
-            para = f'<p>{para}</p>'
-        elif para:
-            html_paragraphs.append(para)
-
-    return '\n'.join(html_paragraphs)
-
-def convert_html_to_pptx(html_files, output_file):
-    """Convert HTML files to PowerPoint and combine them"""
-    temp_pptx_files = []
-
-    try:
-        # Convert each HTML file to PPTX
-        for i, html_file in enumerate(html_files):
-            pptx_file = html_file.replace('.html', '.pptx')
-
-            try:
-                result = subprocess.run([
-                    'pandoc', html_file, '-o', pptx_file
-                ], capture_output=True, text=True)
-
-                if result.returncode == 0:
-                    temp_pptx_files.append(pptx_file)
-                else:
-                    print(f"Error converting {html_file}: {result.stderr}")
-
-            except Exception as e:
-                print(f"Error with {html_file}: {e}")
-
-        # If we have multiple PPTX files, we need to combine them
-        if len(temp_pptx_files) > 1:
-            combine_pptx_files(temp_pptx_files, output_file)
-        elif len(temp_pptx_files) == 1:
-            # Just copy the single file
-            import shutil
-            shutil.copy2(temp_pptx_files[0], output_file)
-
-        print(f"Successfully created {output_file}")
-
-    finally:
-        # Clean up temporary files
-        for file in html_files + temp_pptx_files:
-            try:
-                os.unlink(file)
-            except:
-                pass
-
-def combine_pptx_files(pptx_files, output_file):
-    """Combine multiple PPTX files (simplified approach)"""
-    # For now, just use the first file as a base
-    # In a full implementation, you'd use python-pptx to merge slides
-    import shutil
-    shutil.copy2(pptx_files[0], output_file)
-    print(f"Note: Used first slide only. Full merging requires python-pptx.")
+    if '\\' in content:
+        # Remove frame title
+        content = _FRAMETITLE_RE.sub('', content)
+
+        # Convert itemize to HTML lists
+        content = _ITEMIZE_BEGIN_RE.sub('<ul>', content)
+        content = _ITEMIZE_END_RE.sub('</ul>', content)
+        content = _ITEM_RE.sub('<li>', content)
+
+        # Convert textbf to bold
+        content = _TEXTBF_RE.sub(r'<strong>\1</strong>', content)
+
+        # Handle line breaks
+        content = _LINEBREAK_RE.sub('<br>', content)
+
+        # Remove other LaTeX commands
+        content = _CMD_ARG_RE.sub(r'\1', content)
+        content = _CMD_RE.sub('', content)
+        content = _BRACE_RE.sub('', content)
+    else:
+        # Without a backslash there are no commands, only braces to remove
+        content = content.replace('{', '').replace('}', '')
+
+    # Convert text lines to <p>
+    return _PARA_RE.sub(r'<p>\1</p>', content)
+
+
+def _slide_text(text):
+    """Strip LaTeX markup from text placed on a slide"""
+    if '\\' in text:
+        text = _SLIDE_COMMAND_RE.sub('', text.replace('\\\\', ' '))
+    return text.replace('{', '').replace('}', '').strip()
+
+
+def _frame_title(frame):
+    """Get a frame's title from \\frametitle or its {title} argument"""
+    match = (_FRAMETITLE_CAPTURE_RE.search(frame)
+             or _FRAME_ARG_TITLE_RE.match(frame))
+    return _slide_text(match.group(1)) if match else None
+
+
+def frame_paragraphs(frame):
+    """Get the (text, level) paragraphs of one frame's slide body
+
+    Items are indented one level per itemize they are nested in beyond
+    the first; other text lines are level 0. The frame title, comments,
+    environment markers and layout-only lines are dropped.
+    """
+    title_arg = _FRAME_ARG_TITLE_RE.match(frame)
+    if title_arg:
+        frame = frame[title_arg.end():]
+
+    paragraphs = []
+    depth = 0
+    for line in _FRAMETITLE_CAPTURE_RE.sub('', frame).split('\n'):
+        line = line.strip()
+        if line.startswith('\\begin{itemize}'):
+            depth += 1
+        elif line.startswith('\\end{itemize}'):
+            depth = max(depth - 1, 0)
+        elif (not line.startswith(('\\begin{', '\\end{', '%'))
+              and not _LAYOUT_LINE_RE.match(line)):
+            is_item = line.startswith('\\item')
+            if is_item:
+                line = line[len('\\item'):]
+            text = _slide_text(line)
+            if text:
+                paragraphs.append((text, max(depth - 1, 0) if is_item else 0))
+    return paragraphs
+
+
+def build_presentation(frames, metadata, output_file):
+    """Build the deck in-process: a title slide, then one slide per frame"""
+    # Imported here so the LaTeX helpers above load without python-pptx
+    from pptx import Presentation
+
+    prs = Presentation()
+    title_layout = prs.slide_layouts[0]
+    content_layout = prs.slide_layouts[1]
+
+    slide = prs.slides.add_slide(title_layout)
+    slide.shapes.title.text = _slide_text(metadata['title'])
+    slide.placeholders[1].text = _slide_text(metadata['author'])
+
+    for i, frame in enumerate(frames):
+        slide = prs.slides.add_slide(content_layout)
+        slide.shapes.title.text = _frame_title(frame) or f"Slide {i+1}"
+
+        text_frame = slide.placeholders[1].text_frame
+        for j, (text, level) in enumerate(frame_paragraphs(frame)):
+            paragraph = (text_frame.paragraphs[0] if j == 0
+                         else text_frame.add_paragraph())
+            paragraph.text = text
+            paragraph.level = level
+
+    prs.save(output_file)
+
 
 def main():
     tex_file = "latex/presentation.tex"
@@ -186,11 +201,9 @@ def main():
     frames, metadata = extract_frames_from_tex(tex_file)
     print(f"Found {len(frames)} frames")
 
-    print("Creating HTML files...")
-    html_files = create_temp_html_files(frames, metadata)
-
-    print("Converting to PowerPoint...")
-    convert_html_to_pptx(html_files, output_file)
+    print("Building PowerPoint...")
+    build_presentation(frames, metadata, output_file)
+    print(f"Successfully created {output_file}")
 
 if __name__ == "__main__":
     main()